@@ -33,7 +33,7 @@ class IssueSitemap(Sitemap):
     priority = 0.9
 
     def items(self):
-        return Bounty.objects.current().order_by('-pk').cache()
+        return Bounty.objects.current().for_list().order_by('-pk').cache()
 
     def lastmod(self, obj):
         return obj.modified_on
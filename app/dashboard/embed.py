@@ -164,7 +164,7 @@ def embed(request):
                 github_url__startswith=repo_url,
                 network='mainnet',
                 idx_status__in=['open', 'started', 'submitted']
-            ).order_by('-_val_usd_db')
+            ).for_list().order_by('-_val_usd_db')
         bounties = super_bounties[:length]
 
         # config
@@ -0,0 +1,49 @@
+'''
+    Copyright (C) 2019 Gitcoin Core
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+    GNU Affero General Public License for more details.
+
+    You should have received a copy of the GNU Affero General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+'''
+
+
+from django.core.management.base import BaseCommand
+
+from dashboard.models import Tip
+
+
+class Command(BaseCommand):
+
+    help = 'stores value_in_usdt_then in _val_usd_db for tips saved before that column existed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, dest='batch_size')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_pk = 0
+        updated = 0
+        while True:
+            tips = list(Tip.objects.filter(_val_usd_db__isnull=True, pk__gt=last_pk).order_by('pk')[:batch_size])
+            if not tips:
+                break
+            for tip in tips:
+                try:
+                    value = tip.value_in_usdt_then
+                except Exception as e:
+                    print(tip.pk, e)
+                    continue
+                if value is not None:
+                    updated += Tip.objects.filter(pk=tip.pk).update(_val_usd_db=value)
+            last_pk = tips[-1].pk
+            print(f'{updated} tips updated, up to pk {last_pk}')
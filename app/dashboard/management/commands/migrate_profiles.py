@@ -33,6 +33,7 @@ class Command(BaseCommand):
 
 
         bounties = Bounty.objects.current().filter(web3_created__lt=timezone.datetime(2019,3,5)).filter(network='mainnet')
+        bounties = bounties.prefetch_related('fulfillments')
         for bounty in bounties:
             try:
                 record_bounty_activity('new_bounty', None, bounty, _fulfillment=None, override_created=bounty.web3_created)
@@ -43,7 +44,8 @@ class Command(BaseCommand):
                 print(e)
 
 
-        for tip in Tip.objects.filter(network='mainnet').filter(created_on__lt=timezone.datetime(2019,3,5)):
+        tips = Tip.objects.filter(network='mainnet').filter(created_on__lt=timezone.datetime(2019,3,5))
+        for tip in tips.iterator(chunk_size=2000):
             try:
                 record_tip_activity(tip, tip.username, 'new_tip', override_created=tip.created_on)
                 #print(tip.pk)
@@ -51,6 +53,6 @@ class Command(BaseCommand):
                 print(e)
 
 
-        for instance in Profile.objects.filter(hide_profile=False):
+        for instance in Profile.objects.filter(hide_profile=False).iterator(chunk_size=2000):
             instance.calculate_all()
             instance.save()
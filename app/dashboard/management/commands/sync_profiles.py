@@ -24,6 +24,7 @@ from django.utils import timezone
 from app.utils import sync_profile
 from dashboard.models import Bounty, Profile
 from dashboard.utils import is_blocked
+from git.utils import org_name
 from marketing.utils import is_deleted_account
 
 
@@ -54,7 +55,8 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         # setup
-        handles = set([b.org_name for b in Bounty.objects.current()])
+        github_urls = Bounty.objects.current().values_list('github_url', flat=True).distinct()
+        handles = set([org_name(url) for url in github_urls.iterator(chunk_size=5000)])
         for handle in handles:
             handle = handle.lower()
             print(handle)
@@ -0,0 +1,14 @@
+# Generated by Django 2.2.4 on 2020-04-27 11:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0102_auto_20200422_1452'),
+        ('dashboard', '0102_auto_20200423_1227'),
+    ]
+
+    operations = [
+    ]
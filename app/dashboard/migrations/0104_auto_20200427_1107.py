@@ -0,0 +1,18 @@
+# Generated by Django 2.2.4 on 2020-04-27 11:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0103_merge_20200427_1105'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bounty',
+            name='expires_date',
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
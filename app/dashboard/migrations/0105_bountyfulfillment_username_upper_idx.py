@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2020-04-27 11:22
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0104_auto_20200427_1107'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_bountyfulfillment_username_upper_idx "
+            "ON dashboard_bountyfulfillment (UPPER(fulfiller_github_username::text));",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_bountyfulfillment_username_upper_idx;",
+        ),
+    ]
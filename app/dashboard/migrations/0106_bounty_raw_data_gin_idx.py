@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2020-04-27 11:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0105_bountyfulfillment_username_upper_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_bounty_raw_data_gin_idx "
+            "ON dashboard_bounty USING GIN (raw_data jsonb_path_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_bounty_raw_data_gin_idx;",
+        ),
+    ]
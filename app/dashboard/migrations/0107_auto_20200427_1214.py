@@ -0,0 +1,17 @@
+# Generated by Django 2.2.4 on 2020-04-27 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0106_bounty_raw_data_gin_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(condition=models.Q(is_open=True), fields=['-expires_date'], name='bounty_open_expires_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.4 on 2020-04-27 12:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0107_auto_20200427_1214'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bounty',
+            name='value_in_usdt',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, default=0, max_digits=50, null=True),
+        ),
+    ]
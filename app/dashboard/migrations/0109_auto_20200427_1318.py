@@ -0,0 +1,18 @@
+# Generated by Django 2.2.4 on 2020-04-27 13:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('dashboard', '0108_auto_20200427_1251'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='earning',
+            index=models.Index(fields=['source_type', 'source_id'], name='earning_gfk_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 2.2.4 on 2020-04-27 13:42
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0109_auto_20200427_1318'),
+    ]
+
+    # Match the UPPER(...) LIKE expressions Django emits for the __icontains lookups in BountyQuerySet.keyword
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_bounty_title_trgm_idx "
+            "ON dashboard_bounty USING gin (UPPER(title::text) gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_bounty_title_trgm_idx;",
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_bounty_issue_description_trgm_idx "
+            "ON dashboard_bounty USING gin (UPPER(issue_description::text) gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_bounty_issue_description_trgm_idx;",
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_bounty_issue_keywords_trgm_idx "
+            "ON dashboard_bounty USING gin (UPPER((metadata ->> 'issueKeywords')::text) gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_bounty_issue_keywords_trgm_idx;",
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 2.2.4 on 2020-04-27 14:04
+
+from django.db import migrations, models
+
+# Same rules as Bounty._raw_data_int: 0 when the key is missing or null, the integer when it is one
+# (at most 18 digits, so the cast can't overflow), and NULL otherwise so the model falls back to raw_data
+BACKFILL_DEADLINE_SQL = (
+    "CASE WHEN raw_data->>'{key}' IS NULL THEN 0 "
+    "WHEN raw_data->>'{key}' ~ '^\\s*[-+]?[0-9]{{1,18}}\\s*$' THEN (raw_data->>'{key}')::bigint END"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0110_bounty_keyword_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bounty',
+            name='contract_deadline',
+            field=models.BigIntegerField(blank=True, help_text='Copy of raw_data.contract_deadline; 0 if unset', null=True),
+        ),
+        migrations.AddField(
+            model_name='bounty',
+            name='ipfs_deadline',
+            field=models.BigIntegerField(blank=True, help_text='Copy of raw_data.ipfs_deadline; 0 if unset', null=True),
+        ),
+        migrations.RunSQL(
+            "UPDATE dashboard_bounty SET "
+            f"contract_deadline = {BACKFILL_DEADLINE_SQL.format(key='contract_deadline')}, "
+            f"ipfs_deadline = {BACKFILL_DEADLINE_SQL.format(key='ipfs_deadline')};",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2020-04-27 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0111_auto_20200427_1404'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(condition=models.Q(admin_override_and_hide=False, current_bounty=True), fields=['network', 'web3_created'], name='bounty_current_net_created'),
+        ),
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(condition=models.Q(idx_status__in=['done', 'open', 'reserved', 'started', 'submitted']), fields=['network', 'web3_created'], name='bounty_funded_net_created'),
+        ),
+    ]
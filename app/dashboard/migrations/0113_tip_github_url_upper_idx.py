@@ -0,0 +1,22 @@
+# Generated by Django 2.2.4 on 2020-04-27 15:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0112_auto_20200427_1431'),
+    ]
+
+    # Matches the UPPER(...) = UPPER(...) expression Django emits for Bounty.tips' github_url__iexact lookup
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_tip_github_url_upper_network_idx "
+            "ON dashboard_tip (UPPER(github_url::text), network);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_tip_github_url_upper_network_idx;",
+        ),
+    ]
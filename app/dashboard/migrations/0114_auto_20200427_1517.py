@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2020-04-27 15:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0113_tip_github_url_upper_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bounty',
+            index=models.Index(fields=['standard_bounties_id', 'created_on'], name='bounty_sbid_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bountyfulfillment',
+            index=models.Index(condition=models.Q(accepted=True), fields=['bounty'], name='bf_accepted_idx'),
+        ),
+    ]
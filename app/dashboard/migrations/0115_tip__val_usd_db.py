@@ -0,0 +1,18 @@
+# Generated by Django 2.2.4 on 2020-04-27 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0114_auto_20200427_1517'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tip',
+            name='_val_usd_db',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='value_in_usdt_then, stored on save', max_digits=50, null=True),
+        ),
+    ]
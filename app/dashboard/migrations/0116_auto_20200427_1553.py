@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2020-04-27 15:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0115_tip__val_usd_db'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['profile', 'activity_type', 'created_on'], name='activity_profile_type_created'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['bounty', 'activity_type', 'created_on'], name='activity_bounty_type_created'),
+        ),
+    ]
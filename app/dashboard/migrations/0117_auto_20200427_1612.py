@@ -0,0 +1,17 @@
+# Generated by Django 2.2.4 on 2020-04-27 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0116_auto_20200427_1553'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tip',
+            index=models.Index(fields=['comments_priv', 'network'], name='tip_cmpriv_net_idx'),
+        ),
+    ]
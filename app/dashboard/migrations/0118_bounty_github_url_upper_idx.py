@@ -0,0 +1,23 @@
+# Generated by Django 2.2.4 on 2020-04-27 16:31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('dashboard', '0117_auto_20200427_1612'),
+    ]
+
+    # Matches SendCryptoAsset.bounty: current bounties by UPPER(github_url) = UPPER(...) and network, newest first
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS dashboard_bounty_current_github_url_upper_idx "
+            "ON dashboard_bounty (UPPER(github_url::text), network, web3_created DESC) "
+            "WHERE current_bounty = true;",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS dashboard_bounty_current_github_url_upper_idx;",
+        ),
+    ]
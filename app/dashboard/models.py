@@ -22,8 +22,12 @@ import base64
 import collections
 import json
 import logging
+import re
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
+from html.parser import HTMLParser
+from itertools import chain
 from urllib.parse import urlsplit
 
 from django.conf import settings
@@ -34,8 +38,11 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.humanize.templatetags.humanize import naturalday, naturaltime
 from django.contrib.postgres.fields import ArrayField, JSONField
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import connection, models
-from django.db.models import Count, F, Q, Sum
+from django.db import connection, models, transaction
+from django.db.models import (
+    Avg, Case, CharField, Count, Exists, F, OuterRef, Prefetch, Q, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import TruncDay
 from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.forms.models import model_to_dict
@@ -44,6 +51,7 @@ from django.templatetags.static import static
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
@@ -53,7 +61,6 @@ from app.utils import get_upload_filename, timeout
 from avatar.models import SocialAvatar
 from avatar.utils import get_user_github_avatar_image
 from bleach import clean
-from bs4 import BeautifulSoup
 from dashboard.tokens import addr_to_token, token_by_name
 from economy.models import ConversionRate, EncodeAnything, SuperModel, get_0_time, get_time
 from economy.utils import ConversionRateNotFoundError, convert_amount, convert_token_to_usdt
@@ -74,6 +81,132 @@ logger = logging.getLogger(__name__)
 
 
 CROSS_CHAIN_STANDARD_BOUNTIES_OFFSET = 100000000
+BIGINT_MAX = 2 ** 63 - 1
+HTML_TAG_RE = re.compile(r'(<!--.*?-->|<[^>]*>)')
+WHITESPACE_RE = re.compile(r'\s+')
+# Tip.comments_priv of a tip sent on a townsquare post or comment
+COMMENTS_PRIV_RE = re.compile(r'^(activity|comment):(\d+)$')
+
+# settings lists that are only used for membership tests
+STABLE_COINS = frozenset(settings.STABLE_COINS)
+IGNORE_COMMENTS_FROM = frozenset(settings.IGNORE_COMMENTS_FROM)
+BLOCKED_USERS = frozenset(getattr(settings, 'BLOCKED_USERS', []))
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Collect the text nodes of an html document, like BeautifulSoup's get_text without building a tree."""
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+    def get_text(self):
+        return ''.join(self.parts)
+
+
+def html_to_text(html_str):
+    """Strip the markup from html_str.
+
+    Returns:
+        str: The text content of html_str, with entities unescaped.
+
+    """
+    parser = HTMLTextExtractor()
+    parser.feed(html_str)
+    parser.close()
+    return parser.get_text()
+
+
+def parse_comments_priv(comments_priv):
+    """Parse an "activity:<pk>" or "comment:<pk>" tip comments_priv.
+
+    Returns:
+        tuple: The ('activity' or 'comment', int pk) pair, or (None, None) for any other value.
+
+    """
+    match = COMMENTS_PRIV_RE.match(comments_priv or '')
+    if not match:
+        return None, None
+    return match.group(1), int(match.group(2))
+
+
+def _json_key(key):
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool) or key is None:
+        return json.dumps(key)
+    return repr(key)
+
+
+def json_native(obj):
+    """Copy obj the way json.loads(json.dumps(obj)) would, without building the json string.
+
+    Tuples become lists and non-string dict keys become strings; other values are shared, not copied.
+
+    Returns:
+        The JSON-native copy of obj.
+
+    """
+    if isinstance(obj, dict):
+        return {_json_key(key): json_native(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [json_native(value) for value in obj]
+    return obj
+
+
+# token address => 10 ** decimals, filled lazily by get_token_scale
+_token_scales = {}
+
+
+def get_token_scale(token_address):
+    """Get the 10 ** decimals scale of the mainnet token at token_address.
+
+    Only known tokens are memoized, so a token approved after a failed lookup is still picked up.
+
+    Returns:
+        int: The token scale, or None if the token is unknown.
+
+    """
+    addr = (token_address or '').lower()
+    scale = _token_scales.get(addr)
+    if scale is None:
+        token = addr_to_token(addr)
+        if not token:
+            return None
+        scale = _token_scales[addr] = 10 ** token.get('decimals', 0)
+    return scale
+
+
+@lru_cache(maxsize=8192)
+def get_issue_details_path(org, repo, issue_num):
+    """Get the reversed issue details path for a Github issue, memoized per process.
+
+    Returns:
+        str: The issue_details_new2 path.
+
+    """
+    return reverse('issue_details_new2', kwargs={'ghuser': org, 'ghrepo': repo, 'ghissue': issue_num})
+
+
+_activity_serializer = None
+
+
+def get_activity_serializer():
+    """Get dashboard.router.ActivitySerializer, imported once on first use (router imports this module).
+
+    Returns:
+        type: The ActivitySerializer class.
+
+    """
+    global _activity_serializer
+    if _activity_serializer is None:
+        from dashboard.router import ActivitySerializer
+        _activity_serializer = ActivitySerializer
+    return _activity_serializer
+
 
 class BountyQuerySet(models.QuerySet):
     """Handle the manager queryset for Bounties."""
@@ -82,6 +215,14 @@ class BountyQuerySet(models.QuerySet):
         """Filter results down to current bounties only."""
         return self.filter(current_bounty=True, admin_override_and_hide=False)
 
+    def open(self):
+        """Filter results to bounties that are open and have not expired yet."""
+        return self.filter(is_open=True, expires_date__gt=timezone.now())
+
+    def for_list(self):
+        """Defer the wide text/json columns that list pages never render."""
+        return self.defer(*Bounty.LIST_DEFERRED_FIELDS)
+
     def stats_eligible(self):
         """Exclude results that we don't want to track in statistics."""
         return self.current().exclude(idx_status__in=['unknown', 'cancelled'])
@@ -111,6 +252,9 @@ class BountyQuerySet(models.QuerySet):
         Returns:
             dashboard.models.BountyQuerySet: The QuerySet of bounties filtered by keyword.
 
+        Note:
+            Each of the lookups below is served by a pg_trgm GIN index (see migration 0110).
+
         """
         return self.filter(
             Q(metadata__issueKeywords__icontains=keyword) | \
@@ -126,45 +270,32 @@ class BountyQuerySet(models.QuerySet):
         """Filter results to only bounties not marked as hidden."""
         return self.filter(admin_override_and_hide=False)
 
+    def _with_activity(self, activity_types, needs_review):
+        """Filter results to bounties with an activity of one of the given types and review state."""
+        return self.filter(
+            activities__activity_type__in=activity_types,
+            activities__needs_review=needs_review,
+        ).distinct()
+
     def needs_review(self):
         """Filter results by bounties that need reviewed."""
-        return self.prefetch_related('activities') \
-            .filter(
-                activities__activity_type__in=['bounty_abandonment_escalation_to_mods', 'bounty_abandonment_warning'],
-                activities__needs_review=True,
-            )
+        return self._with_activity(['bounty_abandonment_escalation_to_mods', 'bounty_abandonment_warning'], True)
 
     def reviewed(self):
         """Filter results by bounties that have been reviewed."""
-        return self.prefetch_related('activities') \
-            .filter(
-                activities__activity_type__in=['bounty_abandonment_escalation_to_mods', 'bounty_abandonment_warning'],
-                activities__needs_review=False,
-            )
+        return self._with_activity(['bounty_abandonment_escalation_to_mods', 'bounty_abandonment_warning'], False)
 
     def has_applicant(self):
         """Filter results by bounties that have applicants."""
-        return self.prefetch_related('activities') \
-            .filter(
-                activities__activity_type='worker_applied',
-                activities__needs_review=False,
-            )
+        return self._with_activity(['worker_applied'], False)
 
     def warned(self):
         """Filter results by bounties that have been warned for inactivity."""
-        return self.prefetch_related('activities') \
-            .filter(
-                activities__activity_type='bounty_abandonment_warning',
-                activities__needs_review=True,
-            )
+        return self._with_activity(['bounty_abandonment_warning'], True)
 
     def escalated(self):
         """Filter results by bounties that have been escalated for review."""
-        return self.prefetch_related('activities') \
-            .filter(
-                activities__activity_type='bounty_abandonment_escalation_to_mods',
-                activities__needs_review=True,
-            )
+        return self._with_activity(['bounty_abandonment_escalation_to_mods'], True)
 
     def closed(self):
         """Filter results by bounties that have been closed on Github."""
@@ -179,22 +310,54 @@ class BountyQuerySet(models.QuerySet):
         """Filter results by bounties that are actively funded or funds have been dispersed."""
         return self.filter(idx_status__in=Bounty.FUNDED_STATUSES)
 
+    def with_applicant_counts(self):
+        """Annotate results with their number of applicants, as read by Bounty.no_of_applicants."""
+        return self.annotate(applicants_count=Count('interested', distinct=True))
+
+    def with_status_annotations(self):
+        """Annotate results with the lookups Bounty.status needs, so it runs no queries per row."""
+        return self.annotate(
+            _has_happy_path_tips=Exists(
+                Tip.objects.filter(
+                    github_url__iexact=OuterRef('github_url'), network=OuterRef('network'), is_for_bounty_fulfiller=False
+                ).send_happy_path()
+            ),
+            _has_started_interest=Exists(Interest.objects.filter(bounty=OuterRef('pk'), pending=False)),
+        )
+
+    def annotate_next_revision(self):
+        """Annotate results with the created_on of their next revision, as read by Bounty.was_active_at."""
+        next_revisions = Bounty.objects.filter(
+            standard_bounties_id=OuterRef('standard_bounties_id'), created_on__gt=OuterRef('created_on')
+        ).order_by('created_on').values('created_on')[:1]
+        return self.annotate(
+            _next_bounty_created_on=Case(
+                When(current_bounty=True, then=Value(None)),
+                default=Subquery(next_revisions),
+                output_field=models.DateTimeField(),
+            )
+        )
 
-"""Fields that bonties table should index together."""
-def get_bounty_index_together():
-    import copy
-    index_together = [
-            ["network", "idx_status"],
-            ["current_bounty", "network"],
-            ["current_bounty", "network", "idx_status"],
-            ["current_bounty", "network", "web3_created"],
-            ["current_bounty", "network", "idx_status", "web3_created"],
-        ]
-    additions = ['admin_override_and_hide', 'experience_level', 'is_featured', 'project_length', 'bounty_owner_github_username', 'event']
-    for addition in additions:
-        for ele in copy.copy(index_together):
-            index_together.append([addition] + ele)
-    return index_together
+    def annotate_user_started(self, handle):
+        """Annotate results with whether the given profile has started work, as read by Bounty.has_started_work."""
+        handle = handle.lower()
+        return self.annotate(
+            _user_started=Exists(Interest.objects.filter(bounty=OuterRef('pk'), profile__handle=handle, pending=False)),
+            _user_started_handle=Value(handle, output_field=CharField()),
+        )
+
+
+# Fields that the bounties table should index together: the base combinations below, plus every
+# combination built so far prefixed by each of the additional fields in turn.
+BOUNTY_INDEX_TOGETHER = [
+    ["network", "idx_status"],
+    ["current_bounty", "network"],
+    ["current_bounty", "network", "idx_status"],
+    ["current_bounty", "network", "web3_created"],
+    ["current_bounty", "network", "idx_status", "web3_created"],
+]
+for _addition in ['admin_override_and_hide', 'experience_level', 'is_featured', 'project_length', 'bounty_owner_github_username', 'event']:
+    BOUNTY_INDEX_TOGETHER += [[_addition] + fields for fields in BOUNTY_INDEX_TOGETHER]
 
 
 class Bounty(SuperModel):
@@ -205,10 +368,10 @@ class Bounty(SuperModel):
         EXPERIENCE_LEVELS (list of tuples): The valid experience levels.
         PROJECT_LENGTHS (list of tuples): The possible project lengths.
         STATUS_CHOICES (list of tuples): The valid status stages.
-        FUNDED_STATUSES (list of str): The list of status types considered to have retained value.
-        OPEN_STATUSES (list of str): The list of status types considered open.
-        CLOSED_STATUSES (list of str): The list of status types considered closed.
-        TERMINAL_STATUSES (list of str): The list of status types considered terminal states.
+        FUNDED_STATUSES (frozenset of str): The status types considered to have retained value.
+        OPEN_STATUSES (frozenset of str): The status types considered open.
+        CLOSED_STATUSES (frozenset of str): The status types considered closed.
+        TERMINAL_STATUSES (frozenset of str): The status types considered terminal states.
 
     """
 
@@ -271,11 +434,13 @@ class Bounty(SuperModel):
         ('expired', 'Expired'),
     )
 
-    FUNDED_STATUSES = ['reserved', 'open', 'started', 'submitted', 'done']
-    OPEN_STATUSES = ['reserved', 'open', 'started', 'submitted']
-    CLOSED_STATUSES = ['expired', 'unknown', 'cancelled', 'done']
-    WORK_IN_PROGRESS_STATUSES = ['reserved', 'open', 'started', 'submitted']
-    TERMINAL_STATUSES = ['done', 'expired', 'cancelled']
+    FUNDED_STATUSES = frozenset(['reserved', 'open', 'started', 'submitted', 'done'])
+    OPEN_STATUSES = frozenset(['reserved', 'open', 'started', 'submitted'])
+    CLOSED_STATUSES = frozenset(['expired', 'unknown', 'cancelled', 'done'])
+    WORK_IN_PROGRESS_STATUSES = frozenset(['reserved', 'open', 'started', 'submitted'])
+    TERMINAL_STATUSES = frozenset(['done', 'expired', 'cancelled'])
+    # Heavy columns skipped by `BountyQuerySet.for_list`; only read on detail pages.
+    LIST_DEFERRED_FIELDS = ('raw_data', 'privacy_preferences', 'github_issue_details', 'metadata', 'issue_description')
 
     bounty_state = models.CharField(max_length=50, choices=BOUNTY_STATES, default='open', db_index=True)
     web3_type = models.CharField(max_length=50, default='bounties_network')
@@ -304,8 +469,10 @@ class Bounty(SuperModel):
     reserved_for_user_from = models.DateTimeField(blank=True, null=True)
     reserved_for_user_expiration = models.DateTimeField(blank=True, null=True)
     is_open = models.BooleanField(help_text=_('Whether the bounty is still open for fulfillments.'))
-    expires_date = models.DateTimeField()
+    expires_date = models.DateTimeField(db_index=True)
     raw_data = JSONField()
+    contract_deadline = models.BigIntegerField(null=True, blank=True, help_text=_('Copy of raw_data.contract_deadline; 0 if unset'))
+    ipfs_deadline = models.BigIntegerField(null=True, blank=True, help_text=_('Copy of raw_data.ipfs_deadline; 0 if unset'))
     metadata = JSONField(default=dict, blank=True)
     current_bounty = models.BooleanField(
         default=False, help_text=_('Whether this bounty is the most current revision one or not'), db_index=True)
@@ -349,7 +516,7 @@ class Bounty(SuperModel):
     token_value_time_peg = models.DateTimeField(blank=True, null=True)
     token_value_in_usdt = models.DecimalField(default=0, decimal_places=2, max_digits=50, blank=True, null=True)
     value_in_usdt_now = models.DecimalField(default=0, decimal_places=2, max_digits=50, blank=True, null=True)
-    value_in_usdt = models.DecimalField(default=0, decimal_places=2, max_digits=50, blank=True, null=True)
+    value_in_usdt = models.DecimalField(default=0, decimal_places=2, max_digits=50, blank=True, null=True, db_index=True)
     value_in_eth = models.DecimalField(default=0, decimal_places=2, max_digits=50, blank=True, null=True)
     value_true = models.DecimalField(default=0, decimal_places=2, max_digits=50, blank=True, null=True)
     privacy_preferences = JSONField(default=dict, blank=True)
@@ -381,20 +548,63 @@ class Bounty(SuperModel):
         verbose_name_plural = 'Bounties'
         index_together = [
             ["network", "idx_status"],
-        ] + get_bounty_index_together()
+        ] + BOUNTY_INDEX_TOGETHER
+        indexes = [
+            models.Index(fields=['-expires_date'], name='bounty_open_expires_idx', condition=Q(is_open=True)),
+            models.Index(
+                fields=['network', 'web3_created'], name='bounty_current_net_created',
+                condition=Q(current_bounty=True, admin_override_and_hide=False),
+            ),
+            # idx_status values of Bounty.FUNDED_STATUSES
+            models.Index(
+                fields=['network', 'web3_created'], name='bounty_funded_net_created',
+                condition=Q(idx_status__in=['done', 'open', 'reserved', 'started', 'submitted']),
+            ),
+            # revision lookups in next_bounty/prev_bounty
+            models.Index(fields=['standard_bounties_id', 'created_on'], name='bounty_sbid_created_idx'),
+        ]
 
     def __str__(self):
         """Return the string representation of a Bounty."""
+        return self._display
+
+    @cached_property
+    def _display(self):
+        """Render the string representation once per instance; reset on save."""
         return f"{'(C) ' if self.current_bounty else ''}{self.pk}: {self.title}, {self.value_true} " \
                f"{self.token_name} @ {naturaltime(self.web3_created)}"
 
+    def save_fields(self, fields):
+        """Save only the given fields (and modified_on), or the whole row if the bounty is unsaved.
+
+        Args:
+            fields (list of str): The names of the fields to write.
+
+        """
+        if self.pk:
+            self.save(update_fields=list(fields) + ['modified_on'])
+        else:
+            self.save()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the github_url as loaded, so save() only cleans it when it changes."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_github_url = instance.__dict__.get('github_url')
+        return instance
+
     def save(self, *args, **kwargs):
         """Define custom handling for saving bounties."""
-        from .utils import clean_bounty_url
         if self.bounty_owner_github_username:
             self.bounty_owner_github_username = self.bounty_owner_github_username.lstrip('@')
-        if self.github_url:
+        if self.github_url and self.github_url != getattr(self, '_loaded_github_url', None):
+            from .utils import clean_bounty_url
             self.github_url = clean_bounty_url(self.github_url)
+            self._loaded_github_url = self.github_url
+        self.contract_deadline = self._raw_data_int('contract_deadline')
+        self.ipfs_deadline = self._raw_data_int('ipfs_deadline')
+        self.__dict__.pop('_display', None)
+        self.clear_status_cache()
         super().save(*args, **kwargs)
 
     EVENT_HANDLERS = {
@@ -428,11 +638,17 @@ class Bounty(SuperModel):
                 'cancel_bounty': 'cancelled'}
         }
     }
-
+    # EVENT_HANDLERS flattened to (project_type, bounty_state, event_type) => next bounty_state
+    EVENT_TRANSITIONS = {
+        (project_type, state, event_type): next_state
+        for project_type, states in EVENT_HANDLERS.items()
+        for state, events in states.items()
+        for event_type, next_state in events.items()
+    }
 
     def handle_event(self, event):
         """Handle a new BountyEvent, and potentially change state"""
-        next_state = self.EVENT_HANDLERS.get(self.project_type, {}).get(self.bounty_state, {}).get(event.event_type)
+        next_state = self.EVENT_TRANSITIONS.get((self.project_type, self.bounty_state, event.event_type))
         if next_state:
             self.bounty_state = next_state
             self.save()
@@ -443,23 +659,98 @@ class Bounty(SuperModel):
             return True
         return False
 
+    @classmethod
+    def attach_latest_activity(cls, bounties):
+        """Preload the latest activity of each bounty with a single query.
+
+        Args:
+            bounties (iterable of dashboard.models.Bounty): The bounties to preload latest_activity for.
+
+        Returns:
+            list of dashboard.models.Bounty: The bounties, with their latest activity attached.
+
+        """
+        bounties = list(bounties)
+        activities = Activity.objects.filter(bounty__in=[bounty.pk for bounty in bounties]) \
+            .order_by('bounty_id', '-pk').distinct('bounty_id')
+        latest_activities = {activity.bounty_id: activity for activity in activities}
+        for bounty in bounties:
+            bounty._latest_activity = latest_activities.get(bounty.pk)
+        return bounties
+
+    @classmethod
+    def attach_org_profiles(cls, bounties):
+        """Preload the org profile of each bounty with a single query.
+
+        Args:
+            bounties (iterable of dashboard.models.Bounty): The bounties to preload org_profile for.
+
+        Returns:
+            list of dashboard.models.Bounty: The bounties, with their org profile attached.
+
+        """
+        bounties = list(bounties)
+        names = {bounty.github_org_name.lower() for bounty in bounties if bounty.github_org_name}
+        profiles = Profile.objects.filter(handle__in=names).in_bulk(field_name='handle') if names else {}
+        for bounty in bounties:
+            org_name = bounty.github_org_name
+            bounty._org_profile = profiles.get(org_name.lower()) if org_name else None
+        return bounties
+
     @property
     def latest_activity(self):
-        activity = Activity.objects.filter(bounty=self.pk).order_by('-pk')
-        if activity.exists():
-            from dashboard.router import ActivitySerializer
-            return ActivitySerializer(activity.first()).data
-        return None
+        ActivitySerializer = get_activity_serializer()
+        if hasattr(self, '_latest_activity'):
+            return ActivitySerializer(self._latest_activity).data if self._latest_activity else None
+        activity = Activity.objects.filter(bounty=self.pk).order_by('-pk').first()
+        return ActivitySerializer(activity).data if activity else None
 
     @property
     def profile_pairs(self):
+        from dashboard.utils import get_url_first_indexes # avoid circular import
+        url_first_indexes = get_url_first_indexes()
         profile_handles = []
 
-        for profile in self.interested.select_related('profile').all().order_by('pk'):
-            profile_handles.append((profile.profile.handle, profile.profile.absolute_url))
+        for handle in self.interested.order_by('pk').values_list('profile__handle', flat=True):
+            # mirrors Profile.get_absolute_url without walking the urlconf once per profile
+            prefix = 'profile/' if handle in url_first_indexes else ''
+            profile_handles.append((handle, f"{settings.BASE_URL}{prefix}{handle}"))
 
         return profile_handles
 
+    @property
+    def github_url_parts(self):
+        """Get the organization, repository and issue number parsed from the github_url.
+
+        The parsed parts are memoized on the instance until github_url changes.
+
+        Returns:
+            tuple of str: The (org, repo, issue number) of the Github issue, empty for missing parts.
+
+        """
+        github_url = self.github_url or ''
+        cached = self.__dict__.get('_github_url_parts')
+        if cached is None or cached[0] != github_url:
+            cached = (github_url, (org_name(github_url), repo_name(github_url), issue_number(github_url)))
+            self.__dict__['_github_url_parts'] = cached
+        return cached[1]
+
+    @property
+    def github_url_path(self):
+        """Get the path of the github_url, memoized on the instance until github_url changes.
+
+        Returns:
+            str: The URL path, or None if github_url is not a https://github.com/ URL.
+
+        """
+        github_url = self.github_url or ''
+        cached = self.__dict__.get('_github_url_path')
+        if cached is None or cached[0] != github_url:
+            url_path = urlsplit(github_url).path if github_url.lower()[:19] == 'https://github.com/' else None
+            cached = (github_url, url_path)
+            self.__dict__['_github_url_path'] = cached
+        return cached[1]
+
     def get_absolute_url(self):
         """Get the absolute URL for the Bounty.
 
@@ -480,9 +771,8 @@ class Bounty(SuperModel):
 
         """
         try:
-            _org_name = org_name(self.github_url)
-            _issue_num = int(issue_number(self.github_url))
-            _repo_name = repo_name(self.github_url)
+            _org_name, _repo_name, _issue_num = self.github_url_parts
+            _issue_num = int(_issue_num)
             return f"{'/' if preceding_slash else ''}issue/{_org_name}/{_repo_name}/{_issue_num}/{self.standard_bounties_id}"
         except Exception:
             return f"{'/' if preceding_slash else ''}funding/details?url={self.github_url}"
@@ -494,20 +784,21 @@ class Bounty(SuperModel):
             str: The canonical URL of the Bounty.
 
         """
-        _org_name = org_name(self.github_url)
-        _repo_name = repo_name(self.github_url)
-        _issue_num = int(issue_number(self.github_url))
-        return settings.BASE_URL.rstrip('/') + reverse('issue_details_new2', kwargs={'ghuser': _org_name, 'ghrepo': _repo_name, 'ghissue': _issue_num})
+        _org_name, _repo_name, _issue_num = self.github_url_parts
+        _issue_num = int(_issue_num)
+        return settings.BASE_URL.rstrip('/') + get_issue_details_path(_org_name, _repo_name, _issue_num)
 
     def get_natural_value(self):
-        token = addr_to_token(self.token_address)
-        if not token:
+        scale = get_token_scale(self.token_address)
+        if not scale:
             return 0
-        decimals = token.get('decimals', 0)
-        return float(self.value_in_token) / 10**decimals
+        return float(self.value_in_token) / scale
 
     @property
     def no_of_applicants(self):
+        applicants_count = getattr(self, 'applicants_count', None)
+        if applicants_count is not None:
+            return applicants_count
         return self.interested.count()
 
     @property
@@ -581,6 +872,23 @@ class Bounty(SuperModel):
         """
         return f'{self.get_absolute_url()}?mutate_worker_action=reject&worker={worker}'
 
+    def _raw_data_int(self, key):
+        """Read an integer deadline out of raw_data for the contract_deadline/ipfs_deadline columns.
+
+        Returns:
+            int: The value, or 0 if raw_data has no such key.
+            None: The value is present but not an integer that fits the column.
+
+        """
+        value = self.raw_data.get(key) if isinstance(self.raw_data, dict) else None
+        if value is None:
+            return 0
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        return value if -BIGINT_MAX <= value <= BIGINT_MAX else None
+
     @property
     def can_submit_after_expiration_date(self):
         if self.is_legacy:
@@ -588,8 +896,11 @@ class Bounty(SuperModel):
             return True
 
         # standardbounties
-        contract_deadline = self.raw_data.get('contract_deadline')
-        ipfs_deadline = self.raw_data.get('ipfs_deadline')
+        contract_deadline, ipfs_deadline = self.contract_deadline, self.ipfs_deadline
+        if contract_deadline is None or ipfs_deadline is None:
+            # a deadline in raw_data that isn't a plain integer; 0 means there is none
+            contract_deadline = self.raw_data.get('contract_deadline')
+            ipfs_deadline = self.raw_data.get('ipfs_deadline')
         if not ipfs_deadline:
             # if theres no expiry date in the payload, then expiration date is not mocked, and one cannot submit after expiration date
             return False
@@ -607,14 +918,12 @@ class Bounty(SuperModel):
 
     @property
     def issue_description_text(self):
-        import re
-        tag_re = re.compile(r'(<!--.*?-->|<[^>]*>)')
-        return tag_re.sub('', self.issue_description).strip()
+        return HTML_TAG_RE.sub('', self.issue_description or '').strip()
 
     @property
     def github_issue_number(self):
         try:
-            return int(issue_number(self.github_url))
+            return int(self.github_url_parts[2])
         except Exception:
             return None
 
@@ -624,36 +933,31 @@ class Bounty(SuperModel):
 
     @property
     def org_profile(self):
+        if hasattr(self, '_org_profile'):
+            return self._org_profile
         if not self.org_name:
             return None
-        profiles = Profile.objects.filter(handle=self.org_name.lower())
-        if profiles.exists():
-            return profiles.first()
-        return None
+        return Profile.objects.filter(handle=self.org_name.lower()).first()
 
     @property
     def org_display_name(self): # TODO: Remove POST ORGS
         if self.admin_override_org_name:
             return self.admin_override_org_name
-        return org_name(self.github_url)
+        return self.github_url_parts[0]
 
     @property
     def github_org_name(self):
-        try:
-            return org_name(self.github_url)
-        except Exception:
-            return None
+        return self.github_url_parts[0]
 
     @property
     def github_repo_name(self):
-        try:
-            return repo_name(self.github_url)
-        except Exception:
-            return None
+        return self.github_url_parts[1]
 
     def is_hunter(self, handle):
         """Determine whether or not the profile is the bounty hunter.
 
+        Reads prefetched fulfillments when available, so list callers should prefetch_related('fulfillments').
+
         Args:
             handle (str): The profile handle to be compared.
 
@@ -666,6 +970,8 @@ class Bounty(SuperModel):
     def is_fulfiller(self, handle):
         """Determine whether or not the profile is the bounty is_fulfiller.
 
+        Reads prefetched fulfillments when available, so list callers should prefetch_related('fulfillments').
+
         Args:
             handle (str): The profile handle to be compared.
 
@@ -673,7 +979,10 @@ class Bounty(SuperModel):
             bool: Whether or not the user is the bounty is_fulfiller.
 
         """
-        return any(profile.fulfiller_github_username == handle for profile in self.fulfillments.filter(accepted=True).all())
+        return any(
+            fulfillment.accepted and fulfillment.fulfiller_github_username == handle
+            for fulfillment in self.fulfillments.all()
+        )
 
     def is_funder(self, handle):
         """Determine whether or not the profile is the bounty funder.
@@ -697,6 +1006,8 @@ class Bounty(SuperModel):
             bool: Whether or not the user has started work.
 
         """
+        if not pending and getattr(self, '_user_started_handle', None) == handle.lower():
+            return bool(self._user_started)
         return self.interested.filter(pending=pending, profile__handle=handle.lower()).exists()
 
     @property
@@ -733,19 +1044,26 @@ class Bounty(SuperModel):
     @property
     def keywords_list(self):
         keywords = self.keywords
+        cached = self.__dict__.get('_keywords_list')
+        if cached is None or cached[0] != keywords:
+            cached = (keywords, self._parse_keywords(keywords))
+            self.__dict__['_keywords_list'] = cached
+        return list(cached[1])
+
+    @staticmethod
+    def _parse_keywords(keywords):
         if not keywords:
             return []
-        else:
-            try:
-                return [keyword.strip() for keyword in keywords.split(",")]
-            except AttributeError:
-                return []
+        try:
+            return [keyword.strip() for keyword in keywords.split(",")]
+        except AttributeError:
+            return []
 
     @property
     def fulfillers_handles(self):
         bounty_fulfillers = self.fulfillments.filter(accepted=True).values_list('fulfiller_github_username', flat=True)
         tip_fulfillers = self.tips.values_list('username', flat=True)
-        return list(bounty_fulfillers) + list(tip_fulfillers)
+        return list(bounty_fulfillers.union(tip_fulfillers, all=True))
 
     @property
     def now(self):
@@ -755,7 +1073,7 @@ class Bounty(SuperModel):
     @property
     def past_expiration_date(self):
         """Return true IFF issue is past expiration date"""
-        return timezone.localtime().replace(tzinfo=None) > self.expires_date.replace(tzinfo=None)
+        return timezone.now() > self.expires_date
 
     @property
     def past_hard_expiration_date(self):
@@ -783,10 +1101,11 @@ class Bounty(SuperModel):
         # standard bounties
         is_traditional_bounty_type = self.project_type == 'traditional'
         try:
-            has_tips = self.tips.filter(is_for_bounty_fulfiller=False).send_happy_path().exists()
-            if has_tips and is_traditional_bounty_type and not self.is_open :
-                return 'done'
             if not self.is_open:
+                # tips only matter once the bounty is closed
+                has_tips = self._has_happy_path_tips
+                if has_tips and is_traditional_bounty_type:
+                    return 'done'
                 if self.accepted:
                     return 'done'
                 elif self.past_hard_expiration_date:
@@ -800,7 +1119,7 @@ class Bounty(SuperModel):
             if self.pk and self.project_type in ['contest', 'cooperative']:
                 return 'open'
             if self.num_fulfillments == 0:
-                if self.pk and self.interested.filter(pending=False).exists():
+                if self.pk and self._has_started_interest:
                     return 'started'
                 elif self.is_reserved:
                     return 'reserved'
@@ -829,6 +1148,9 @@ class Bounty(SuperModel):
 
     @property
     def get_value_in_usdt(self):
+        if self.token_name in STABLE_COINS:
+            # a stable coin's value doesn't depend on time, so skip the status lookup
+            return self.value_in_usdt_at_time(None)
         if self.status in self.OPEN_STATUSES:
             return self.value_in_usdt_now
         return self.value_in_usdt_then
@@ -841,7 +1163,7 @@ class Bounty(SuperModel):
         decimals = 10 ** 18
         if self.token_name == 'USDT':
             return float(self.value_in_token / 10 ** 6)
-        if self.token_name in settings.STABLE_COINS:
+        if self.token_name in STABLE_COINS:
             return float(self.value_in_token / 10 ** 18)
         try:
             return round(float(convert_amount(self.value_true, self.token_name, 'USDT', at_time)), 2)
@@ -854,7 +1176,7 @@ class Bounty(SuperModel):
 
     @property
     def token_value_in_usdt_now(self):
-        if self.token_name in settings.STABLE_COINS:
+        if self.token_name in STABLE_COINS:
             return 1
         try:
             return round(convert_token_to_usdt(self.token_name), 2)
@@ -886,50 +1208,37 @@ class Bounty(SuperModel):
 
     @property
     def turnaround_time_accepted(self):
-        try:
-            return (self.get_fulfillment_accepted_on - self.web3_created).total_seconds()
-        except Exception:
-            return None
+        return self._seconds_since_web3_created(self.get_fulfillment_accepted_on)
 
     @property
     def turnaround_time_started(self):
-        try:
-            return (self.get_fulfillment_started_on - self.web3_created).total_seconds()
-        except Exception:
-            return None
+        return self._seconds_since_web3_created(self.get_fulfillment_started_on)
 
     @property
     def turnaround_time_submitted(self):
-        try:
-            return (self.get_fulfillment_submitted_on - self.web3_created).total_seconds()
-        except Exception:
+        return self._seconds_since_web3_created(self.get_fulfillment_submitted_on)
+
+    def _seconds_since_web3_created(self, when):
+        if when is None or self.web3_created is None:
             return None
+        return (when - self.web3_created).total_seconds()
 
     @property
     def get_fulfillment_accepted_on(self):
-        try:
-            return self.fulfillments.filter(accepted=True).first().accepted_on
-        except Exception:
-            return None
+        return getattr(self._accepted_fulfillment, 'accepted_on', None)
 
     @property
     def get_fulfillment_submitted_on(self):
-        try:
-            return self.fulfillments.first().created_on
-        except Exception:
-            return None
+        return getattr(self._first_fulfillment, 'created_on', None)
 
     @property
     def get_fulfillment_started_on(self):
-        try:
-            return self.interested.first().created
-        except Exception:
-            return None
+        return getattr(self._first_interest, 'created', None)
 
     @property
     def hourly_rate(self):
         try:
-            hours_worked = self.fulfillments.filter(accepted=True).first().fulfiller_hours_worked
+            hours_worked = self._accepted_fulfillment.fulfiller_hours_worked
             return float(self.value_in_usdt) / float(hours_worked)
         except Exception:
             return None
@@ -954,10 +1263,9 @@ class Bounty(SuperModel):
             str: The Github API URL associated with the issue.
 
         """
-        from urllib.parse import urlparse
-        if self.github_url.lower()[:19] != 'https://github.com/':
+        url_path = self.github_url_path
+        if url_path is None:
             return ''
-        url_path = urlparse(self.github_url).path
         return 'https://api.github.com/repos' + url_path
 
     def fetch_issue_item(self, item_type='body'):
@@ -977,9 +1285,10 @@ class Bounty(SuperModel):
                 item = issue_description.json().get(item_type, '')
                 if item_type == 'body' and item:
                     self.issue_description = item
+                    self.save_fields(['issue_description'])
                 elif item_type == 'title' and item:
                     self.title = item
-                self.save()
+                    self.save_fields(['title'])
                 return item
         return ''
 
@@ -993,12 +1302,12 @@ class Bounty(SuperModel):
             dict: The comments data dictionary provided by Github.
 
         """
-        if self.github_url.lower()[:19] != 'https://github.com/':
+        url_path = self.github_url_path
+        if url_path is None:
             return []
 
-        parsed_url = urlsplit(self.github_url)
         try:
-            github_user, github_repo, _, github_issue = parsed_url.path.split('/')[1:5]
+            github_user, github_repo, _, github_issue = url_path.split('/')[1:5]
         except ValueError:
             logger.info(f'Invalid github url for Bounty: {self.pk} -- {self.github_url}')
             return []
@@ -1007,17 +1316,23 @@ class Bounty(SuperModel):
             logger.info(f'Bounty {self.pk} contains an invalid github url {self.github_url}')
             return []
         comment_count = 0
+        # created_at is a fixed-width UTC ISO-8601 string, so the latest one is also the largest
+        max_created_at = None
         for comment in comments:
-            if (isinstance(comment, dict) and comment.get('user', {}).get('login', '') not in settings.IGNORE_COMMENTS_FROM):
+            if not isinstance(comment, dict):
+                continue
+            if comment.get('user', {}).get('login', '') not in IGNORE_COMMENTS_FROM:
                 comment_count += 1
+            created_at = comment.get('created_at')
+            if created_at and (max_created_at is None or created_at > max_created_at):
+                max_created_at = created_at
         self.github_comments = comment_count
-        if comment_count:
-            comment_times = [datetime.strptime(comment['created_at'], '%Y-%m-%dT%H:%M:%SZ') for comment in comments]
-            max_comment_time = max(comment_times)
-            max_comment_time = max_comment_time.replace(tzinfo=pytz.utc)
-            self.last_comment_date = max_comment_time
+        update_fields = ['github_comments']
+        if comment_count and max_created_at:
+            self.last_comment_date = datetime.strptime(max_created_at, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=pytz.utc)
+            update_fields.append('last_comment_date')
         if save:
-            self.save()
+            self.save_fields(update_fields)
         return comments
 
     @property
@@ -1036,18 +1351,30 @@ class Bounty(SuperModel):
         except Exception:
             return None
 
+    @cached_property
+    def _next_bounty_created_on(self):
+        """Get the created_on of the next revision of this bounty, without loading the revision.
+
+        Can be preloaded for a whole queryset with BountyQuerySet.annotate_next_revision.
+
+        """
+        if self.current_bounty:
+            return None
+        return Bounty.objects.filter(standard_bounties_id=self.standard_bounties_id, created_on__gt=self.created_on) \
+            .order_by('created_on').values_list('created_on', flat=True).first()
+
     # returns true if this bounty was active at _time
     def was_active_at(self, _time):
         if _time < self.web3_created:
             return False
         if _time < self.created_on:
             return False
-        next_bounty = self.next_bounty
-        if next_bounty is None:
+        next_created_on = self._next_bounty_created_on
+        if next_created_on is None:
             return True
-        if next_bounty.created_on > _time:
-            return True
-        return False
+        return next_created_on > _time
+
+    ACTION_URL_ITEMS = ('fulfill', 'increase', 'accept', 'cancel', 'payout', 'advanced_payout', 'invoice')
 
     def action_urls(self):
         """Provide URLs for bounty related actions.
@@ -1057,10 +1384,7 @@ class Bounty(SuperModel):
 
         """
         params = f'pk={self.pk}&network={self.network}'
-        urls = {}
-        for item in ['fulfill', 'increase', 'accept', 'cancel', 'payout', 'advanced_payout', 'invoice', ]:
-            urls.update({item: f'/issue/{item}?{params}'})
-        return urls
+        return {item: f'/issue/{item}?{params}' for item in self.ACTION_URL_ITEMS}
 
     def is_notification_eligible(self, var_to_check=True):
         """Determine whether or not a notification is eligible for transmission outside of production.
@@ -1092,27 +1416,60 @@ class Bounty(SuperModel):
         """
         fulfilled = False
         if self.project_type == 'traditional':
-            fulfilled = self.interested.filter(pending=False).exists()
+            fulfilled = self._has_started_interest
         return fulfilled
 
-    @property
+    @cached_property
     def needs_review(self):
         if self.activities.filter(needs_review=True).exists():
             return True
         return False
 
+    # Queries behind status/is_project_type_fulfilled/needs_review, the fulfillment dates
+    # psave_bounty denormalizes and was_active_at, memoized per instance until save() or a
+    # change to interested (see clear_status_cache). The first two can also be preloaded by
+    # BountyQuerySet.with_status_annotations.
+    STATUS_CACHE_ATTRS = (
+        '_has_happy_path_tips', '_has_started_interest', 'needs_review',
+        '_accepted_fulfillment', '_first_fulfillment', '_first_interest', '_next_bounty_created_on',
+    )
+
+    @cached_property
+    def _has_happy_path_tips(self):
+        return self.tips.filter(is_for_bounty_fulfiller=False).send_happy_path().exists()
+
+    @cached_property
+    def _has_started_interest(self):
+        return self.interested.filter(pending=False).exists()
+
+    # The three lookups below only load the columns their readers use.
+    @cached_property
+    def _accepted_fulfillment(self):
+        return self.fulfillments.filter(accepted=True).only('accepted_on', 'fulfiller_hours_worked').first() if self.pk else None
+
+    @cached_property
+    def _first_fulfillment(self):
+        return self.fulfillments.only('created_on').first() if self.pk else None
+
+    @cached_property
+    def _first_interest(self):
+        return self.interested.only('created').first() if self.pk else None
+
+    def clear_status_cache(self):
+        """Drop the memoized queries that status and its related properties depend on."""
+        for attr in self.STATUS_CACHE_ATTRS:
+            self.__dict__.pop(attr, None)
+
     @property
     def github_issue_state(self):
         current_github_state = self.github_issue_details.get('state') if self.github_issue_details else None
         if not current_github_state:
             try:
-                _org_name = org_name(self.github_url)
-                _repo_name = repo_name(self.github_url)
-                _issue_num = issue_number(self.github_url)
+                _org_name, _repo_name, _issue_num = self.github_url_parts
                 gh_issue_details = get_gh_issue_details(_org_name, _repo_name, int(_issue_num))
                 if gh_issue_details:
                     self.github_issue_details = gh_issue_details
-                    self.save()
+                    self.save_fields(['github_issue_details'])
                     current_github_state = self.github_issue_details.get('state', 'open')
             except Exception as e:
                 logger.info(e)
@@ -1136,9 +1493,9 @@ class Bounty(SuperModel):
     @property
     def bulk_payout_tips(self):
         """Return the Bulk payout tips associated with this bounty."""
-        queryset = self.tips.filter(is_for_bounty_fulfiller=False, metadata__is_clone__isnull=True)
-        return (queryset.filter(from_address=self.bounty_owner_address) |
-                queryset.filter(from_name=self.bounty_owner_github_username))
+        return self.tips.filter(is_for_bounty_fulfiller=False, metadata__is_clone__isnull=True).filter(
+            Q(from_address=self.bounty_owner_address) | Q(from_name=self.bounty_owner_github_username)
+        )
 
     @property
     def paid(self):
@@ -1146,30 +1503,32 @@ class Bounty(SuperModel):
         if self.status != 'done':
             return []  # to save the db hits
 
-        return_list = []
-        for fulfillment in self.fulfillments.filter(accepted=True):
-            if fulfillment.fulfiller_github_username:
-                return_list.append(fulfillment.fulfiller_github_username)
-        for tip in self.tips.send_happy_path():
-            if tip.username:
-                return_list.append(tip.username)
-        return list(set(return_list))
+        fulfillers = self.fulfillments.filter(accepted=True).values_list('fulfiller_github_username', flat=True)
+        tippers = self.tips.send_happy_path().values_list('username', flat=True)
+        return list({handle for handle in chain(fulfillers, tippers) if handle})
 
     @property
     def additional_funding_summary(self):
         """Return a dict describing the additional funding from crowdfunding that this object has"""
         ret = {}
-        for tip in self.tips.filter(is_for_bounty_fulfiller=True).send_happy_path():
+        tips = list(self.tips.filter(is_for_bounty_fulfiller=True).send_happy_path())
+        tokens = {tip.tokenName for tip in tips}
+        # latest rate per token, in one query
+        conversion_rates = {
+            conversion_rate.from_currency: conversion_rate
+            for conversion_rate in ConversionRate.objects.filter(
+                from_currency__in=tokens,
+                to_currency='USDT',
+            ).order_by('from_currency', '-timestamp').distinct('from_currency')
+        } if tokens else {}
+        for tip in tips:
             token = tip.tokenName
             obj = ret.get(token, {})
 
             if not obj:
                 obj['amount'] = 0.0
 
-                conversion_rate = ConversionRate.objects.filter(
-                    from_currency=token,
-                    to_currency='USDT',
-                ).order_by('-timestamp').first()
+                conversion_rate = conversion_rates.get(token)
 
                 if conversion_rate:
                     obj['ratio'] = (float(conversion_rate.to_amount) / float(conversion_rate.from_amount))
@@ -1186,22 +1545,12 @@ class Bounty(SuperModel):
     @property
     def additional_funding_summary_sentence(self):
         afs = self.additional_funding_summary
-        tokens = afs.keys()
 
-        if not tokens:
+        if not afs:
             return ''
 
-        items = []
-        usd_value = 0.0
-
-        for token_name in tokens:
-            obj = afs[token_name]
-            ratio = obj['ratio']
-            amount = obj['amount']
-            usd_value += amount * ratio
-            items.append(f"{amount} {token_name}")
-
-        sentence = ", ".join(items)
+        sentence = ", ".join(f"{obj['amount']} {token_name}" for token_name, obj in afs.items())
+        usd_value = sum((obj['amount'] * obj['ratio'] for obj in afs.values()), 0.0)
 
         if usd_value:
             sentence += f" worth {usd_value} USD"
@@ -1228,20 +1577,16 @@ class Bounty(SuperModel):
 
     @property
     def can_remarket(self):
-        result = True
-
         if self.remarketed_count and self.remarketed_count >= 2:
-            result = False
+            return False
 
         if self.last_remarketed:
             minimum_wait_after_remarketing = self.last_remarketed + timezone.timedelta(minutes=settings.MINUTES_BETWEEN_RE_MARKETING)
             if timezone.now() < minimum_wait_after_remarketing:
-                result = False
-
-        if self.interested.count() > 0:
-            result = False
+                return False
 
-        return result
+        # only hit the db once the cheap checks pass
+        return not self.interested.exists()
 
     @property
     def is_reserved(self):
@@ -1267,23 +1612,11 @@ class Bounty(SuperModel):
             days = delta.days
 
             if days > 0:
-                if days % 7 == 0:
-                    if days == 7:
-                        return '1 week'
-                    else:
-                        weeks = int(days / 7)
-                        return f'{weeks} weeks'
-
-                if days == 1:
-                    return '1 day'
-                else:
-                    return f'{days} days'
+                weeks, remainder = divmod(days, 7)
+                amount, unit = (weeks, 'week') if not remainder else (days, 'day')
             else:
-                hours = int(int(delta.total_seconds()) / 3600)
-                if hours == 1:
-                    return '1 hour'
-                else:
-                    return f'{hours} hours'
+                amount, unit = int(int(delta.total_seconds()) / 3600), 'hour'
+            return f"{amount} {unit}{'' if amount == 1 else 's'}"
         else:
             return ''
 
@@ -1351,6 +1684,11 @@ class BountyFulfillment(SuperModel):
     payout_status = models.CharField(max_length=10, choices=PAYOUT_STATUS, blank=True)
     payout_amount = models.DecimalField(null=True, blank=True, decimal_places=4, max_digits=50)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['bounty'], name='bf_accepted_idx', condition=Q(accepted=True)),
+        ]
+
     def __str__(self):
         """Define the string representation of BountyFulfillment.
 
@@ -1369,7 +1707,7 @@ class BountyFulfillment(SuperModel):
 
     @property
     def should_hide(self):
-        return self.fulfiller_github_username in settings.BLOCKED_USERS
+        return self.fulfiller_github_username in BLOCKED_USERS
 
     @property
     def to_json(self):
@@ -1507,9 +1845,10 @@ class SendCryptoAsset(SuperModel):
 
     # TODO: DRY
     def get_natural_value(self):
-        token = addr_to_token(self.tokenAddress)
-        decimals = token['decimals']
-        return float(self.amount) / 10**decimals
+        scale = get_token_scale(self.tokenAddress)
+        if not scale:
+            return 0
+        return float(self.amount) / scale
 
     @property
     def value_true(self):
@@ -1517,9 +1856,7 @@ class SendCryptoAsset(SuperModel):
 
     @property
     def amount_in_wei(self):
-        token = addr_to_token(self.tokenAddress)
-        decimals = token['decimals'] if token else 18
-        return float(self.amount) * 10**decimals
+        return float(self.amount) * (get_token_scale(self.tokenAddress) or 10**18)
 
     @property
     def amount_in_whole_units(self):
@@ -1536,10 +1873,7 @@ class SendCryptoAsset(SuperModel):
     def org_profile(self):
         if not self.org_name:
             return None
-        profiles = Profile.objects.filter(handle=self.org_name.lower())
-        if profiles.count():
-            return profiles.first()
-        return None
+        return Profile.objects.filter(handle=self.org_name.lower()).first()
 
     # TODO: DRY
     @property
@@ -1579,7 +1913,7 @@ class SendCryptoAsset(SuperModel):
 
     def value_in_usdt_at_time(self, at_time):
         decimals = 1
-        if self.tokenName in settings.STABLE_COINS:
+        if self.tokenName in STABLE_COINS:
             return float(self.amount)
         try:
             return round(float(convert_amount(self.amount, self.tokenName, 'USDT', at_time)) / decimals, 2)
@@ -1636,12 +1970,16 @@ class SendCryptoAsset(SuperModel):
 
     @property
     def bounty(self):
-        try:
-            return Bounty.objects.current().filter(
-                github_url__iexact=self.github_url,
-                network=self.network).order_by('-web3_created').first()
-        except Bounty.DoesNotExist:
-            return None
+        """Get the current bounty for this github_url, memoized until github_url or network changes."""
+        key = (self.github_url, self.network)
+        cached = self.__dict__.get('_bounty')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        bounty = Bounty.objects.current().filter(
+            github_url__iexact=self.github_url,
+            network=self.network).order_by('-web3_created').first()
+        self.__dict__['_bounty'] = (key, bounty)
+        return bounty
 
 
 class Tip(SendCryptoAsset):
@@ -1654,38 +1992,84 @@ class Tip(SendCryptoAsset):
     sender_profile = models.ForeignKey(
         'dashboard.Profile', related_name='sent_tips', on_delete=models.SET_NULL, null=True, blank=True
     )
+    _val_usd_db = models.DecimalField(
+        null=True, blank=True, decimal_places=2, max_digits=50, help_text=_('value_in_usdt_then, stored on save')
+    )
+
+    class Meta:
+        # "activity:<pk>" tip lookups in Activity.tip_count_usd/tip_count_eth
+        indexes = [
+            models.Index(fields=['comments_priv', 'network'], name='tip_cmpriv_net_idx'),
+        ]
+
+    @property
+    def parsed_comments_priv(self):
+        """Get the (kind, pk) this tip's comments_priv refers to, memoized until comments_priv changes."""
+        cached = self.__dict__.get('_parsed_comments_priv')
+        if cached is None or cached[0] != self.comments_priv:
+            cached = (self.comments_priv, parse_comments_priv(self.comments_priv))
+            self.__dict__['_parsed_comments_priv'] = cached
+        return cached[1]
 
     @property
     def is_programmatic_comment(self):
-        if 'activity:' in self.comments_priv:
-            return True
-        if 'comment:' in self.comments_priv:
-            return True
+        return self.parsed_comments_priv[0] is not None
 
     @property
     def attached_object(self):
-        if not self.comments_priv:
-            return None
-        if 'activity:' in self.comments_priv:
-            pk = self.comments_priv.split(":")[1]
+        """Get the Activity or Comment this tip was sent on, memoized until comments_priv changes."""
+        cached = self.__dict__.get('_attached_object')
+        if cached is not None and cached[0] == self.comments_priv:
+            return cached[1]
+        kind, pk = self.parsed_comments_priv
+        obj = None
+        if kind == 'activity':
             obj = Activity.objects.get(pk=pk)
-            return obj
-        if 'comment:' in self.comments_priv:
-            pk = self.comments_priv.split(":")[1]
+        elif kind == 'comment':
             from townsquare.models import Comment
             obj = Comment.objects.get(pk=pk)
-            return obj
+        self.__dict__['_attached_object'] = (self.comments_priv, obj)
+        return obj
+
+    @classmethod
+    def attach_objects(cls, tips):
+        """Preload attached_object for a batch of tips with one query per attached model.
+
+        Args:
+            tips (iterable of dashboard.models.Tip): The tips to preload attached_object for.
+
+        Returns:
+            list of dashboard.models.Tip: The tips, with their attached object preloaded.
+
+        """
+        from townsquare.models import Comment
+        tips = list(tips)
+        pks = {'activity': set(), 'comment': set()}
+        for tip in tips:
+            kind, pk = tip.parsed_comments_priv
+            if kind:
+                pks[kind].add(pk)
+        objects = {
+            'activity': Activity.objects.in_bulk(pks['activity']) if pks['activity'] else {},
+            'comment': Comment.objects.in_bulk(pks['comment']) if pks['comment'] else {},
+        }
+        for tip in tips:
+            kind, pk = tip.parsed_comments_priv
+            if kind:
+                tip.__dict__['_attached_object'] = (tip.comments_priv, objects[kind].get(pk))
+        return tips
 
     def trigger_townsquare(instance):
         if instance.network == 'mainnet' or settings.DEBUG:
             from townsquare.models import Comment
             network = instance.network if instance.network != 'mainnet' else ''
-            if 'activity:' in instance.comments_priv:
+            kind = instance.parsed_comments_priv[0]
+            if kind == 'activity':
                 activity=instance.attached_object
                 comment = f"Just sent a tip of {instance.amount} {network} ETH to @{instance.username}"
                 comment = Comment.objects.create(profile=instance.sender_profile, activity=activity, comment=comment)
 
-            if 'comment:' in instance.comments_priv:
+            if kind == 'comment':
                 _comment=instance.attached_object
                 _comment.save()
                 comment = f"Just sent a tip of {instance.amount} {network} ETH to @{instance.username}"
@@ -1744,44 +2128,57 @@ class TipPayout(SuperModel):
 def psave_tip(sender, instance, **kwargs):
     # when a new tip is saved, make sure it doesnt have whitespace in it
     instance.username = instance.username.replace(' ', '')
-    # set missing attributes
-    if not instance.sender_profile:
-        profiles = Profile.objects.filter(handle=instance.from_username.lower())
-        if profiles.exists():
-            instance.sender_profile = profiles.first()
-    if not instance.recipient_profile:
-        profiles = Profile.objects.filter(handle=instance.username.lower())
-        if profiles.exists():
-            instance.recipient_profile = profiles.first()
+    try:
+        instance._val_usd_db = instance.value_in_usdt_then
+    except Exception:
+        instance._val_usd_db = None
+    # set missing attributes, looking both profiles up in one query
+    handles = {}
+    if not instance.sender_profile_id:
+        handles['sender_profile'] = instance.from_username.lower()
+    if not instance.recipient_profile_id:
+        handles['recipient_profile'] = instance.username.lower()
+    if handles:
+        profiles = {profile.handle: profile for profile in Profile.objects.filter(handle__in=handles.values())}
+        for attr, handle in handles.items():
+            if handle in profiles:
+                setattr(instance, attr, profiles[handle])
+
+
+def update_tip_earning(tip):
+    value_true = 0
+    value_usd = 0
+    try:
+        value_true = tip.value_true
+        value_usd = tip.value_in_usdt_then
+    except:
+        pass
+    Earning.objects.update_or_create(
+        source_type=ContentType.objects.get_for_model(Tip),
+        source_id=tip.pk,
+        defaults={
+            "created_on":tip.created_on,
+            "org_profile":tip.org_profile,
+            "from_profile":tip.sender_profile,
+            "to_profile":tip.recipient_profile,
+            "value_usd":value_usd,
+            "url":'https://gitcoin.co/tips',
+            "network":tip.network,
+            "txid":tip.txid,
+            "token_name":tip.tokenName,
+            "token_value":value_true,
+        }
+        )
 
 
 @receiver(post_save, sender=Tip, dispatch_uid="post_save_tip")
 def postsave_tip(sender, instance, created, **kwargs):
-    is_valid = instance.sender_profile != instance.recipient_profile and instance.txid
+    is_valid = instance.sender_profile_id != instance.recipient_profile_id and instance.txid
     if instance.pk and is_valid:
-        value_true = 0
-        value_usd = 0
-        try:
-            value_true = instance.value_true
-            value_usd = instance.value_in_usdt_then
-        except:
-            pass
-        Earning.objects.update_or_create(
-            source_type=ContentType.objects.get(app_label='dashboard', model='tip'),
-            source_id=instance.pk,
-            defaults={
-                "created_on":instance.created_on,
-                "org_profile":instance.org_profile,
-                "from_profile":instance.sender_profile,
-                "to_profile":instance.recipient_profile,
-                "value_usd":value_usd,
-                "url":'https://gitcoin.co/tips',
-                "network":instance.network,
-                "txid":instance.txid,
-                "token_name":instance.tokenName,
-                "token_value":value_true,
-            }
-            )
+        # the earning is written by a worker once the tip is committed
+        from dashboard.tasks import sync_tip_earning
+        pk = instance.pk
+        transaction.on_commit(lambda: sync_tip_earning.delay(pk))
 
 # method for updating
 @receiver(pre_save, sender=Bounty, dispatch_uid="psave_bounty")
@@ -1805,22 +2202,24 @@ def psave_bounty(sender, instance, **kwargs):
     instance.fulfillment_accepted_on = instance.get_fulfillment_accepted_on
     instance.fulfillment_submitted_on = instance.get_fulfillment_submitted_on
     instance.fulfillment_started_on = instance.get_fulfillment_started_on
-    instance._val_usd_db = instance.get_value_in_usdt if instance.get_value_in_usdt else 0
-    instance._val_usd_db_now = instance.get_value_in_usdt_now if instance.get_value_in_usdt_now else 0
     instance.idx_experience_level = idx_experience_level.get(instance.experience_level, 0)
     instance.idx_project_length = idx_project_length.get(instance.project_length, 0)
     instance.token_value_time_peg = instance.get_token_value_time_peg
     instance.token_value_in_usdt = instance.get_token_value_in_usdt
+
+    # each price lookup runs once; value_true and value_in_usdt_now go first
+    # since the usdt/eth conversions below read them off the instance
+    instance.value_true = instance.get_value_true
     instance.value_in_usdt_now = instance.get_value_in_usdt_now
     instance.value_in_usdt = instance.get_value_in_usdt
     instance.value_in_eth = instance.get_value_in_eth
-    instance.value_true = instance.get_value_true
+    instance._val_usd_db = instance.value_in_usdt or 0
+    instance._val_usd_db_now = instance.value_in_usdt_now or 0
 
     if not instance.bounty_owner_profile:
         if instance.bounty_owner_github_username:
-            profiles = Profile.objects.filter(handle=instance.bounty_owner_github_username.lower().replace('@',''))
-            if profiles.exists():
-                instance.bounty_owner_profile = profiles.first()
+            handle = instance.bounty_owner_github_username.lower().replace('@', '')
+            instance.bounty_owner_profile = Profile.objects.filter(handle=handle).first()
 
     # this is added to allow activities, project submissions, etc. to attach to a specific bounty based on standard_bounties_id - DL
     if instance.pk and not instance.is_bounties_network and instance.standard_bounties_id == 0:
@@ -1828,45 +2227,54 @@ def psave_bounty(sender, instance, **kwargs):
 
     from django.contrib.contenttypes.models import ContentType
     from search.models import SearchResult
-    ct = ContentType.objects.get(app_label='dashboard', model='bounty')
+    ct = ContentType.objects.get_for_model(Bounty)
     if instance.current_bounty and instance.pk:
-        SearchResult.objects.update_or_create(
-            source_type=ct,
-            source_id=instance.pk,
-            defaults={
-                "created_on":instance.web3_created,
-                "title":instance.title,
-                "description":instance.issue_description,
-                "url":instance.url,
-                "visible_to":None,
-                'img_url': instance.get_avatar_url(True),
-            }
-            )
-        # delete any old bounties
-        if instance.prev_bounty and instance.prev_bounty.pk:
-            for sr in SearchResult.objects.filter(source_type=ct, source_id=instance.prev_bounty.pk):
-                sr.delete()
+        prev_bounty = instance.prev_bounty
+        with transaction.atomic():
+            SearchResult.objects.update_or_create(
+                source_type=ct,
+                source_id=instance.pk,
+                defaults={
+                    "created_on":instance.web3_created,
+                    "title":instance.title,
+                    "description":instance.issue_description,
+                    "url":instance.url,
+                    "visible_to":None,
+                    'img_url': instance.get_avatar_url(True),
+                }
+                )
+            # delete any old bounties
+            if prev_bounty and prev_bounty.pk:
+                SearchResult.objects.filter(source_type=ct, source_id=prev_bounty.pk).delete()
+
+
+def update_fulfillment_earning(fulfillment):
+    bounty = fulfillment.bounty
+    Earning.objects.update_or_create(
+        source_type=ContentType.objects.get_for_model(BountyFulfillment),
+        source_id=fulfillment.pk,
+        defaults={
+            "created_on":fulfillment.created_on,
+            "org_profile":bounty.org_profile,
+            "from_profile":bounty.bounty_owner_profile,
+            "to_profile":fulfillment.profile,
+            "value_usd":bounty.value_in_usdt_then,
+            "url":bounty.url,
+            "network":bounty.network,
+            "txid":'',
+            "token_name":bounty.token_name,
+            "token_value":bounty.value_in_token,
+        }
+        )
 
 
 @receiver(post_save, sender=BountyFulfillment, dispatch_uid="psave_bounty_fulfill")
 def psave_bounty_fulfilll(sender, instance, **kwargs):
     if instance.pk and instance.accepted:
-        Earning.objects.update_or_create(
-            source_type=ContentType.objects.get(app_label='dashboard', model='bountyfulfillment'),
-            source_id=instance.pk,
-            defaults={
-                "created_on":instance.created_on,
-                "org_profile":instance.bounty.org_profile,
-                "from_profile":instance.bounty.bounty_owner_profile,
-                "to_profile":instance.profile,
-                "value_usd":instance.bounty.value_in_usdt_then,
-                "url":instance.bounty.url,
-                "network":instance.bounty.network,
-                "txid":'',
-                "token_name":instance.bounty.token_name,
-                "token_value":instance.bounty.value_in_token,
-            }
-            )
+        # the earning is written by a worker once the fulfillment is committed
+        from dashboard.tasks import sync_fulfillment_earning
+        pk = instance.pk
+        transaction.on_commit(lambda: sync_fulfillment_earning.delay(pk))
 
 
 class InterestQuerySet(models.QuerySet):
@@ -1925,6 +2333,11 @@ class Interest(SuperModel):
     def bounties(self):
         return Bounty.objects.filter(interested=self)
 
+    @property
+    def bounty_pks(self):
+        """Get the pks of this interest's bounties without loading the bounty rows."""
+        return Bounty.objects.filter(interested=self).values_list('pk', flat=True)
+
     def change_status(self, status=None):
         if status is None or status not in self.WORK_STATUSES:
             return self
@@ -1954,9 +2367,15 @@ def psave_interest(sender, instance, **kwargs):
     print("signal: updating bounties psave_interest")
     for bounty in Bounty.objects.filter(interested=instance):
 
-        if bounty.bounty_reserved_for_user == instance.profile:
+        if bounty.bounty_reserved_for_user_id == instance.profile_id:
             auto_user_approve(instance, bounty)
-        bounty.save()
+        # only the interest derived columns can have changed, so write those
+        # directly instead of re-running the whole psave_bounty recompute
+        Bounty.objects.filter(pk=bounty.pk).update(
+            idx_status=bounty.status,
+            fulfillment_started_on=bounty.get_fulfillment_started_on,
+            modified_on=timezone.now(),
+        )
 
 
 class ActivityQuerySet(models.QuerySet):
@@ -1996,37 +2415,54 @@ class ActivityQuerySet(models.QuerySet):
         """
         from townsquare.models import Like, Comment
 
-        # Posts created by that user
-        posts = self.filter(profile=profile)
+        # Posts tipped by that user (even a comment); comments_priv is "activity:<pk>" or "comment:<pk>"
+        tipped_activity_pks, tipped_comment_pks = [], []
+        for comments_priv in Tip.objects.filter(sender_profile=profile).exclude(comments_priv='') \
+                .values_list('comments_priv', flat=True):
+            kind, pk = parse_comments_priv(comments_priv)
+            if kind == 'activity':
+                tipped_activity_pks.append(pk)
+            elif kind == 'comment':
+                tipped_comment_pks.append(pk)
+
+        posts = self.filter(
+            # Posts created by that user
+            Q(profile=profile) |
+            # Posts that the user likes (even a comment)
+            Q(pk__in=Like.objects.filter(profile=profile).values('activity_id')) |
+            Q(pk__in=Comment.objects.filter(likes__contains=[profile.pk]).values('activity_id')) |
+            Q(pk__in=tipped_activity_pks) |
+            Q(pk__in=Comment.objects.filter(pk__in=tipped_comment_pks).values('activity_id')) |
+            # Posts the user commented on
+            Q(pk__in=Comment.objects.filter(profile=profile).values('activity_id'))
+        )
 
-        # Posts that the user likes (even a comment)
-        likes = Like.objects.filter(profile=profile).all()
-        activity_pks = [_.activity.pk for _ in likes]
-        posts.union(self.filter(pk__in=activity_pks))
+        return posts
 
-        comments = Comment.objects.filter(likes__contains=[profile.pk]).all()
-        activity_pks = [_.activity.pk for _ in comments]
-        posts.union(self.filter(pk__in=activity_pks))
+    def with_view_props(self, user):
+        """Prefetch the likes and favorites read by Activity.view_props_for.
 
-        # Posts tipped by that user (even a comment)
-        tips = Tip.objects.filter(sender_profile=profile).all()
-        activity_pks = []
-        for tip in tips:
-            if  tip.comments_priv:
-                obj = tip.attached_object()
-                if 'activity:' in tip.comments_priv:
-                    activity_pks.append(obj.pk)
-                if 'comment:' in tip.comments_priv:
-                    activity_pks.append(obj.activity.pk)
-        posts.union(self.filter(pk__in=activity_pks))
+        Args:
+            user (User): The user the activities are being rendered for.
 
+        Returns:
+            ActivityQuerySet: The queryset with likes and the user's favorites prefetched.
 
-        # Posts the user commented on
-        comments = Comment.objects.filter(profile=profile).all()
-        activity_pks = [_.activity.pk for _ in comments]
-        posts.union(self.filter(pk__in=activity_pks))
+        """
+        from townsquare.models import Favorite, Like
 
-        return posts
+        activities = self.prefetch_related(Prefetch('likes', queryset=Like.objects.select_related('profile')))
+        if not user.is_authenticated:
+            return activities
+        return activities.prefetch_related(
+            Prefetch('favorite_set', queryset=Favorite.objects.filter(user=user), to_attr='_user_favorites'),
+        )
+
+    def feed(self):
+        """Join the foreign keys read while rendering activity feed items."""
+        return self.select_related(
+            'profile', 'other_profile', 'bounty', 'tip', 'kudos', 'grant', 'subscription', 'hackathonevent',
+        )
 
 
 class Activity(SuperModel):
@@ -2034,6 +2470,7 @@ class Activity(SuperModel):
 
     Attributes:
         ACTIVITY_TYPES (list of tuples): The valid activity types.
+        ACTIVITY_TYPE_NAMES (dict): The display name of each activity type, keyed by type.
 
     """
 
@@ -2082,6 +2519,7 @@ class Activity(SuperModel):
         ('new_hackathon_project', 'New Hackathon Project'),
         ('flagged_grant', 'Flagged Grant'),
     ]
+    ACTIVITY_TYPE_NAMES = dict(ACTIVITY_TYPES)
 
     profile = models.ForeignKey(
         'dashboard.Profile',
@@ -2154,9 +2592,24 @@ class Activity(SuperModel):
     hidden = models.BooleanField(default=False, db_index=True)
     cached_view_props = JSONField(default=dict, blank=True)
 
+    # Bounty lifecycle activities can be recorded twice (web3 sync and the request that triggered
+    # it); post_add_activity only looks for duplicates of these.
+    DEDUPE_ACTIVITY_TYPES = frozenset([
+        'new_bounty', 'start_work', 'stop_work', 'work_submitted', 'work_done', 'worker_approved',
+        'worker_rejected', 'worker_applied', 'increased_bounty', 'killed_bounty', 'new_crowdfund',
+        'bounty_abandonment_escalation_to_mods', 'bounty_abandonment_warning',
+    ])
+
     # Activity QuerySet Manager
     objects = ActivityQuerySet.as_manager()
 
+    class Meta:
+        # duplicate lookup in post_add_activity
+        indexes = [
+            models.Index(fields=['profile', 'activity_type', 'created_on'], name='activity_profile_type_created'),
+            models.Index(fields=['bounty', 'activity_type', 'created_on'], name='activity_bounty_type_created'),
+        ]
+
     def __str__(self):
         """Define the string representation of an interested profile."""
         return f"{self.profile.handle} type: {self.activity_type} created: {naturalday(self.created)} " \
@@ -2222,9 +2675,9 @@ class Activity(SuperModel):
         Returns:
             str: The humanized nameactivity_type
         """
-        for activity_type in self.ACTIVITY_TYPES:
-            if activity_type[0] == self.activity_type:
-                return activity_type[1]
+        name = self.ACTIVITY_TYPE_NAMES.get(self.activity_type)
+        if name is not None:
+            return name
         return ' '.join([x.capitalize() for x in self.activity_type.split('_')])
 
     def point_value(self):
@@ -2236,22 +2689,36 @@ class Activity(SuperModel):
         return point_values.get(self.activity_type, 0)
 
     def i18n_name(self):
-        return _(next((x[1] for x in self.ACTIVITY_TYPES if x[0] == self.activity_type), 'Unknown type'))
+        return _(self.ACTIVITY_TYPE_NAMES.get(self.activity_type, 'Unknown type'))
 
-    @property
+    @cached_property
     def text(self):
+        """Get the plain text of this activity's feed item.
+
+        The rendered text is stored in cached_view_props so later reads skip the
+        template render and html parse; it's dropped whenever the activity is saved.
+
+        Returns:
+            str: The feed item text with its whitespace collapsed.
+
+        """
+        txt = self.cached_view_props.get('text')
+        if txt is None:
+            txt = self.render_text()
+            self.cached_view_props['text'] = txt
+            if self.pk:
+                # update() rather than save() so the activity signals don't fire
+                Activity.objects.filter(pk=self.pk).update(cached_view_props=self.cached_view_props)
+        return txt
+
+    def render_text(self):
         params = {
             'row': self,
             'hide_date': True,
             'hide_likes': True,
         }
         html_str = render_to_string('shared/activity.html', params)
-        soup = BeautifulSoup(html_str)
-        txt = soup.get_text()
-        txt = txt.replace("\n","")
-        for i in range(0, 100):
-            txt = txt.replace("  ",' ')
-        return txt
+        return WHITESPACE_RE.sub(' ', html_to_text(html_str)).strip()
 
 
     def has_voted(self, user):
@@ -2270,11 +2737,21 @@ class Activity(SuperModel):
         if not user.is_authenticated:
             return vp
 
+        # likes (and their profiles) come from the prefetch cache when the
+        # queryset was built with ActivityQuerySet.with_view_props
+        if 'likes' in getattr(self, '_prefetched_objects_cache', {}):
+            likes = [(like.profile_id, like.profile.handle) for like in self.likes.all()]
+        else:
+            likes = list(self.likes.values_list('profile_id', 'profile__handle'))
         vp.metadata['liked'] = False
-        if self.likes.exists():
-            vp.metadata['liked'] = self.likes.filter(profile=user.profile).exists()
-            vp.metadata['likes_title'] = "Liked by " + ",".join(self.likes.values_list('profile__handle', flat=True)) + '. '
-        vp.metadata['favorite'] = self.favorite_set.filter(user=user).exists()
+        if likes:
+            profile_id = user.profile.pk
+            vp.metadata['liked'] = any(like_profile_id == profile_id for like_profile_id, _ in likes)
+            vp.metadata['likes_title'] = "Liked by " + ",".join(handle for _, handle in likes) + '. '
+        if hasattr(self, '_user_favorites'):
+            vp.metadata['favorite'] = bool(self._user_favorites)
+        else:
+            vp.metadata['favorite'] = self.favorite_set.filter(user=user).exists()
         vp.metadata['poll_answered'] = self.has_voted(user)
 
         return vp
@@ -2283,13 +2760,17 @@ class Activity(SuperModel):
     def tip_count_usd(self):
         network = 'rinkeby' if settings.DEBUG else 'mainnet'
         tips = Tip.objects.filter(comments_priv=f"activity:{self.pk}", network=network)
-        return sum([tip.value_in_usdt for tip in tips])
+        total = tips.aggregate(total=Sum('_val_usd_db'))['total'] or 0
+        # tips whose usd value couldn't be computed when saved (see the backfill_tip_val_usd command)
+        return float(total) + sum(tip.value_in_usdt or 0 for tip in tips.filter(_val_usd_db__isnull=True))
 
     @property
     def tip_count_eth(self):
         network = 'rinkeby' if settings.DEBUG else 'mainnet'
         tips = Tip.objects.filter(comments_priv=f"activity:{self.pk}", network=network)
-        return sum([tip.value_in_eth for tip in tips])
+        # ETH tips are summed in the db; other tokens still need a (current) conversion each
+        total = tips.filter(tokenName='ETH').aggregate(total=Sum('amount'))['total'] or 0
+        return float(total) + sum(float(tip.value_in_eth or 0) for tip in tips.exclude(tokenName='ETH'))
 
     @property
     def secondary_avatar_url(self):
@@ -2338,6 +2819,10 @@ class Activity(SuperModel):
 
 @receiver(pre_save, sender=Activity, dispatch_uid="psave_activity")
 def psave_activity(sender, instance, **kwargs):
+    # the stored feed text may be stale once anything on the activity changes
+    instance.cached_view_props.pop('text', None)
+    instance.__dict__.pop('text', None)
+
     if instance.bounty and instance.bounty.event:
         if not instance.hackathonevent:
             instance.hackathonevent = instance.bounty.event
@@ -2348,7 +2833,7 @@ def psave_activity(sender, instance, **kwargs):
 
 @receiver(post_save, sender=Activity, dispatch_uid="post_add_activity")
 def post_add_activity(sender, instance, created, **kwargs):
-    if created:
+    if created and instance.activity_type in Activity.DEDUPE_ACTIVITY_TYPES:
 
         # make sure duplicate activity feed items are removed
         dupes = Activity.objects.exclude(pk=instance.pk)
@@ -2363,8 +2848,7 @@ def post_add_activity(sender, instance, created, **kwargs):
         dupes = dupes.filter(activity_type=instance.activity_type)
         dupes = dupes.filter(metadata=instance.metadata)
         dupes = dupes.filter(needs_review=instance.needs_review)
-        for dupe in dupes:
-            dupe.delete()
+        dupes.delete()
 
 
 
@@ -2424,16 +2908,22 @@ class BountyInvites(SuperModel):
     def __str__(self):
         return f"Inviter: {self.inviter}; Invitee: {self.invitee}; Bounty: {self.bounty}"
 
-    @property
+    @cached_property
     def get_bounty_invite_url(self):
         """Returns a unique url for each bounty and one who is inviting
 
+        Uses the same encoding as dashboard.utils.get_bounty_invite_url so that
+        get_bounty_from_invite_url can decode it.
+
         Returns:
-            A unique string for each bounty
+            A unique string for each bounty, or None if the invite has no inviter or bounty
         """
-        salt = "X96gRAVvwx52uS6w4QYCUHRfR3OaoB"
-        string = self.inviter.username + salt + self.bounty
-        return base64.urlsafe_b64encode(string.encode()).decode()
+        from dashboard.utils import get_bounty_invite_url
+        inviter = self.inviter.values_list('username', flat=True).first()
+        bounty_id = self.bounty.values_list('pk', flat=True).first()
+        if inviter is None or bounty_id is None:
+            return None
+        return get_bounty_invite_url(inviter, bounty_id)
 
 
 class ProfileQuerySet(models.QuerySet):
@@ -2451,8 +2941,12 @@ class ProfileQuerySet(models.QuerySet):
         """Filter results to only hidden profiles."""
         return self.filter(hide_profile=True)
 
+    def with_relations(self):
+        """Join the user and kudos wallet and prefetch the user's groups for profile lists."""
+        return self.select_related('user', 'preferred_kudos_wallet').prefetch_related('user__groups')
+
 
-class ProfileManager(models.Manager):
+class ProfileManager(models.Manager.from_queryset(ProfileQuerySet)):
     def get_queryset(self):
         return ProfileQuerySet(self.model, using=self._db).slim()
 
@@ -2532,6 +3026,7 @@ class Profile(SuperModel):
         ('PL', 'Passively looking and open to hearing new opportunities'),
         ('N', 'Not open to hearing new opportunities'),
     ]
+    JOB_SEARCH_STATUS_NAMES = dict(JOB_SEARCH_STATUS)
     PERSONAS = [
         ('hunter', 'Hunter'),
         ('funder', 'Funder'),
@@ -2647,9 +3142,9 @@ class Profile(SuperModel):
     objects_full = ProfileQuerySet.as_manager()
     @property
     def subscribed_threads(self):
-        tips = Tip.objects.filter(Q(pk__in=self.received_tips.all()) | Q(pk__in=self.sent_tips.all())).filter(comments_priv__icontains="activity:").all()
-        tips = [tip.comments_priv.split(':')[1] for tip in tips]
-        tips = [ele for ele in tips if ele.isnumeric()]
+        tips = Tip.objects.filter(Q(recipient_profile=self) | Q(sender_profile=self), comments_priv__icontains="activity:")
+        tips = [parse_comments_priv(comments_priv) for comments_priv in tips.values_list('comments_priv', flat=True)]
+        tips = [pk for kind, pk in tips if kind == 'activity']
         activities = Activity.objects.filter(
          Q(pk__in=self.likes.values_list('activity__pk', flat=True))
          | Q(pk__in=self.comments.values_list('activity__pk', flat=True))
@@ -2680,16 +3175,17 @@ class Profile(SuperModel):
     def matchranking_this_round(self):
         if hasattr(self, '_matchranking_this_round'):
             return self._matchranking_this_round
-        from townsquare.models import MatchRound
-        mr = MatchRound.objects.current().cache(timeout=60).first()
-        if mr:
-            mr = mr.ranking.filter(profile=self).cache(timeout=60).first()
-            self._matchranking_this_round = mr
-            if mr:
-                return mr
-        return None
-
-    @property
+        from townsquare.models import MatchRanking
+        # the ranking in the current round, in one query; truncated to the minute so the
+        # cacheops key stays the same for the cache timeout instead of changing every call
+        now = timezone.now().replace(second=0, microsecond=0)
+        mr = MatchRanking.objects.filter(
+            profile=self, round__valid_from__lte=now, round__valid_to__gt=now,
+        ).select_related('round').cache(timeout=60).first()
+        self._matchranking_this_round = mr
+        return mr
+
+    @cached_property
     def quest_caste(self):
         castes = [
             'Etherean',
@@ -2745,7 +3241,7 @@ class Profile(SuperModel):
             return TribeMember.objects.filter(profile=self).exclude(status='rejected').exclude(profile__user=None)
         return TribeMember.objects.filter(org=self).exclude(status='rejected').exclude(profile__user=None)
 
-    @property
+    @cached_property
     def ref_code(self):
         return hex(self.pk).replace("0x",'')
 
@@ -2798,50 +3294,62 @@ class Profile(SuperModel):
 
         return kudos_transfers
 
-    @property
+    @cached_property
     def get_num_actions(self):
-        num = 0
-        num += self.get_sent_kudos.count()
-        num += self.get_my_kudos.count()
-        num += self.get_my_tips.count()
-        num += self.get_sent_tips.count()
-        num += self.get_my_grants.count()
-        return num
+        """Count the kudos and tips this profile sent or received, plus its grants.
+
+        Sent and received kudos (and tips) are counted together in one aggregate query per model,
+        matching the rows get_sent_kudos/get_my_kudos and get_sent_tips/get_my_tips return.
+
+        Returns:
+            int: The number of actions.
+
+        """
+        from kudos.models import KudosTransfer
+        received_kudos = Q(recipient_profile=self)
+        if self.preferred_payout_address:
+            received_kudos |= Q(receive_address__iexact=self.preferred_payout_address)
+        sent_kudos = Q(sender_profile=self) | Q(from_address__iexact=self.preferred_payout_address)
+        kudos = KudosTransfer.objects.send_happy_path().filter(
+            received_kudos | sent_kudos,
+            kudos_token_cloned_from__contract__network=settings.KUDOS_NETWORK,
+        ).aggregate(received=Count('id', filter=received_kudos), sent=Count('id', filter=sent_kudos))
+
+        received_tips = Q(username__iexact=self.handle)
+        sent_tips = Q(from_username__iexact=self.handle)
+        tips = Tip.objects.filter(received_tips | sent_tips).aggregate(
+            received=Count('id', filter=received_tips), sent=Count('id', filter=sent_tips)
+        )
+
+        return kudos['received'] + kudos['sent'] + tips['received'] + tips['sent'] + self.get_my_grants.count()
 
     def get_average_star_rating(self, scale=1):
         """Returns the average star ratings (overall and individual topic)
         for a particular user"""
 
-        feedbacks = FeedbackEntry.objects.filter(receiver_profile=self).all()
-        average_rating = {}
-        average_rating['overall'] = sum([feedback.rating for feedback in feedbacks]) * scale \
-            / feedbacks.count() if feedbacks.count() != 0 else 0
-        average_rating['code_quality_rating'] = sum([feedback.code_quality_rating for feedback in feedbacks]) * scale \
-            / feedbacks.exclude(code_quality_rating=0).count() if feedbacks.exclude(code_quality_rating=0).count() != 0 else 0
-        average_rating['communication_rating'] = sum([feedback.communication_rating for feedback in feedbacks]) * scale \
-            / feedbacks.exclude(communication_rating=0).count() if feedbacks.exclude(communication_rating=0).count() != 0 else 0
-        average_rating['recommendation_rating'] = sum([feedback.recommendation_rating for feedback in feedbacks]) * scale \
-            / feedbacks.exclude(recommendation_rating=0).count() if feedbacks.exclude(recommendation_rating=0).count() != 0 else 0
-        average_rating['satisfaction_rating'] = sum([feedback.satisfaction_rating for feedback in feedbacks]) * scale \
-            / feedbacks.exclude(satisfaction_rating=0).count() if feedbacks.exclude(satisfaction_rating=0).count() != 0 else 0
-        average_rating['speed_rating'] = sum([feedback.speed_rating for feedback in feedbacks]) * scale \
-            / feedbacks.exclude(speed_rating=0).count() if feedbacks.exclude(speed_rating=0).count() != 0 else 0
-        average_rating['total_rating'] = feedbacks.count()
+        # topic ratings of 0 mean "not rated", so they're left out of that topic's average
+        topics = ['code_quality_rating', 'communication_rating', 'recommendation_rating', 'satisfaction_rating', 'speed_rating']
+        aggregates = {topic: Avg(topic, filter=~Q(**{topic: 0})) for topic in topics}
+        average_rating = FeedbackEntry.objects.filter(receiver_profile=self).aggregate(
+            overall=Avg('rating'), total_rating=Count('id'), **aggregates
+        )
+        for key in ['overall'] + topics:
+            average_rating[key] = (average_rating[key] or 0) * scale
         return average_rating
 
 
     @property
     def get_my_verified_check(self):
-        verification = UserVerificationModel.objects.filter(user=self.user).first()
+        verification = UserVerificationModel.objects.filter(user_id=self.user_id).first()
         return verification
 
-    @property
+    @cached_property
     def get_profile_referral_code(self):
         return base64.urlsafe_b64encode(self.handle.encode()).decode()
 
     @property
     def job_status_verbose(self):
-        return dict(Profile.JOB_SEARCH_STATUS).get(self.job_search_status, 'Unknown Job Status')
+        return Profile.JOB_SEARCH_STATUS_NAMES.get(self.job_search_status, 'Unknown Job Status')
 
     @property
     def active_bounties(self):
@@ -2878,23 +3386,34 @@ class Profile(SuperModel):
     def sent_leaderboard(self):
         return self.leaderboard_helper(self.sent_earnings, 'to_profile')
 
-    def leaderboard_helper(self, earnings, distinct_on):
+    def leaderboard_helper(self, earnings, distinct_on, limit=None):
         order_field = f'{distinct_on}__handle'
         earnings = earnings.filter(network=self.get_network())
-        leaderboard = earnings.values(order_field).annotate(sum=Sum('value_usd')).annotate(count=Count('value_usd'))
+        leaderboard = earnings.values(order_field).annotate(sum=Sum('value_usd'), count=Count('value_usd'))
         kwargs = {order_field:None}
-        return [(ele[order_field], ele['count'], ele['sum']) for ele in leaderboard.exclude(**kwargs).order_by('-sum')]
+        leaderboard = leaderboard.exclude(**kwargs).order_by('-sum')
+        if limit:
+            # top N only; the LIMIT runs in postgres
+            leaderboard = leaderboard[:limit]
+        return [(ele[order_field], ele['count'], ele['sum']) for ele in leaderboard.iterator(chunk_size=200)]
 
     @property
     def bounties(self):
-        fulfilled_bounty_ids = self.fulfilled.all().values_list('bounty_id')
-        bounties = Bounty.objects.filter(github_url__istartswith=self.github_url, current_bounty=True)
-        for interested in self.interested.all().nocache():
-            bounties = bounties | Bounty.objects.filter(interested=interested, current_bounty=True)
-        bounties = bounties | Bounty.objects.filter(pk__in=fulfilled_bounty_ids, current_bounty=True)
-        bounties = bounties | Bounty.objects.filter(bounty_owner_github_username__iexact=self.handle, current_bounty=True) | Bounty.objects.filter(bounty_owner_github_username__iexact="@" + self.handle, current_bounty=True)
-        bounties = bounties | Bounty.objects.filter(github_url__in=[url for url in self.tips.values_list('github_url', flat=True)], current_bounty=True)
-        bounties = bounties.distinct()
+        # one statement of uncorrelated subqueries instead of OR-ing a queryset per interest
+        interested_bounty_ids = Bounty.interested.through.objects.filter(interest__profile=self).values('bounty_id')
+        fulfilled_bounty_ids = self.fulfilled.values('bounty_id')
+        tipped_urls = Tip.objects.filter(
+            Q(github_url__startswith=self.github_url) | Q(username__iexact=self.handle)
+        ).values('github_url')
+        bounties = Bounty.objects.filter(
+            Q(github_url__istartswith=self.github_url) |
+            Q(pk__in=interested_bounty_ids) |
+            Q(pk__in=fulfilled_bounty_ids) |
+            Q(bounty_owner_github_username__iexact=self.handle) |
+            Q(bounty_owner_github_username__iexact="@" + self.handle) |
+            Q(github_url__in=tipped_urls),
+            current_bounty=True,
+        ).distinct()
         return bounties.order_by('-web3_created')
 
     @property
@@ -2939,23 +3458,27 @@ class Profile(SuperModel):
         self.avg_hourly_rate = self.calc_avg_hourly_rate()
         self.success_rate = self.calc_success_rate()
         self.reliability = self.calc_reliability_ranking() # must be calc'd last
-        self.as_dict = json.loads(json.dumps(self.to_dict()))
-        self.as_representation = json.loads(json.dumps(self.to_representation))
+        self.as_dict = json_native(self.to_dict())
+        self.as_representation = json_native(self.to_representation)
         self.last_calc_date = timezone.now() + timezone.timedelta(seconds=1)
 
     def get_persona_action_count(self):
-        hunter_count = 0
-        funder_count = 0
-
-        hunter_count += self.interested.count()
-        hunter_count += self.received_tips.count()
-        hunter_count += self.grant_admin.count()
-        hunter_count += self.fulfilled.count()
+        hunter_relations = ['interested', 'received_tips', 'grant_admin', 'fulfilled']
+        funder_relations = ['bounties_funded', 'sent_tips', 'grant_contributor']
 
-        funder_count += self.bounties_funded.count()
-        funder_count += self.sent_tips.count()
-        funder_count += self.grant_contributor.count()
+        # one SELECT of a COUNT subquery per reverse relation, instead of a query each
+        counts = {}
+        for name in hunter_relations + funder_relations:
+            manager = getattr(self, name)
+            fk_name = manager.field.name
+            counts[f'{name}_count'] = Subquery(
+                manager.order_by().values(fk_name).annotate(count=Count('pk')).values('count'),
+                output_field=models.IntegerField(),
+            )
+        counts = Profile.objects.filter(pk=self.pk).annotate(**counts).values(*counts).first() or {}
 
+        hunter_count = sum(counts.get(f'{name}_count') or 0 for name in hunter_relations)
+        funder_count = sum(counts.get(f'{name}_count') or 0 for name in funder_relations)
         return hunter_count, funder_count
 
     def calculate_and_save_persona(self, respect_defaults=True, decide_only_one=False):
@@ -3084,7 +3607,7 @@ class Profile(SuperModel):
             bool: Whether or not the user is a moderator.
 
         """
-        return self.user.groups.filter(name='Moderators').cache().exists() if self.user else False
+        return 'Moderators' in self.user_group_names
 
     @property
     def is_alpha_tester(self):
@@ -3096,7 +3619,23 @@ class Profile(SuperModel):
         """
         if self.user.is_staff:
             return True
-        return self.user.groups.filter(name='Alpha_Testers').cache().exists() if self.user else False
+        return 'Alpha_Testers' in self.user_group_names
+
+    @cached_property
+    def user_group_names(self):
+        """Get the names of the user's auth groups.
+
+        Reads the prefetched groups when the profile came from ProfileQuerySet.with_relations.
+
+        Returns:
+            frozenset: The group names, empty when the profile has no user.
+
+        """
+        if not self.user:
+            return frozenset()
+        if 'groups' in getattr(self.user, '_prefetched_objects_cache', {}):
+            return frozenset(group.name for group in self.user.groups.all())
+        return frozenset(self.user.groups.values_list('name', flat=True).cache())
 
     @property
     def is_staff(self):
@@ -3141,8 +3680,9 @@ class Profile(SuperModel):
         """
 
         # setup
-        action_dates = self.actions.all().values_list('created_on', flat=True)
-        action_dates = set([ele.replace(tzinfo=pytz.utc).strftime('%m/%d/%Y') for ele in action_dates])
+        # the distinct utc days with an action, truncated and de-duplicated by postgres
+        action_days = self.actions.annotate(day=TruncDay('created_on', tzinfo=pytz.utc))
+        action_dates = set(day.date() for day in action_days.values_list('day', flat=True).distinct())
         start_date = timezone.datetime(self.created_on.year, self.created_on.month, self.created_on.day).replace(tzinfo=pytz.utc)
         end_date = timezone.datetime(timezone.now().year, timezone.now().month, timezone.now().day).replace(tzinfo=pytz.utc)
 
@@ -3159,7 +3699,7 @@ class Profile(SuperModel):
             if not is_weekday:
                 continue
 
-            has_action_during_window = iterdate.strftime('%m/%d/%Y') in action_dates
+            has_action_during_window = iterdate.date() in action_dates
             if has_action_during_window:
                 this_streak += 1
                 max_streak = max(max_streak, this_streak)
@@ -3355,7 +3895,8 @@ class Profile(SuperModel):
         last_quarter = datetime.now() - timedelta(days=90)
         bounties = self.bounties.filter(created_on__gte=last_quarter, network='mainnet')
         fulfilled_bounties = [
-            bounty for bounty in bounties if bounty.is_fulfiller(self.handle) and bounty.status == 'done'
+            bounty for bounty in bounties.prefetch_related('fulfillments')
+            if bounty.is_fulfiller(self.handle) and bounty.status == 'done'
         ]
         fulfilled_bounties_count = len(fulfilled_bounties)
         funded_bounties = self.get_funded_bounties()
@@ -3381,7 +3922,6 @@ class Profile(SuperModel):
             total_funded_hours = 0
             funded_fulfillments_with_hours_counted = 0
             if funded_bounty_fulfillments_count:
-                from decimal import Decimal
                 for fulfillment in funded_bounty_fulfillments:
                     if isinstance(fulfillment.fulfiller_hours_worked, Decimal):
                         total_funded_hours += fulfillment.fulfiller_hours_worked
@@ -3455,17 +3995,17 @@ class Profile(SuperModel):
             from marketing.utils import get_or_save_email_subscriber
             user_coding_languages = get_or_save_email_subscriber(self.email, 'internal').keywords
             if user_coding_languages is not None:
-                potential_bounties = Bounty.objects.all()
-                relevant_bounties = Bounty.objects.none()
-                for keyword in user_coding_languages:
-                    relevant_bounties = relevant_bounties.union(potential_bounties.current().filter(
-                            network=Profile.get_network(),
-                            metadata__icontains=keyword,
-                            idx_status__in=['open'],
-                            ).order_by('?')
-                    )
-                relevant_bounties = relevant_bounties[:3]
-                relevant_bounties = list(relevant_bounties)
+                relevant_bounties = []
+                if user_coding_languages:
+                    # one OR'ed filter rather than a union of a query per keyword
+                    keyword_filter = Q()
+                    for keyword in user_coding_languages:
+                        keyword_filter |= Q(metadata__icontains=keyword)
+                    relevant_bounties = list(Bounty.objects.current().filter(
+                        keyword_filter,
+                        network=Profile.get_network(),
+                        idx_status__in=['open'],
+                    ).order_by('?')[:3])
         # Round to 2 places of decimals to be diplayed in templates
         completetion_percent = float('%.2f' % completetion_percent)
         funded_fulfilled_percent = float('%.2f' % funded_fulfilled_percent)
@@ -4123,7 +4663,7 @@ def psave_profile(sender, instance, **kwargs):
     from search.models import SearchResult
     if instance.pk:
         SearchResult.objects.update_or_create(
-            source_type=ContentType.objects.get(app_label='dashboard', model='profile'),
+            source_type=ContentType.objects.get_for_model(Profile),
             source_id=instance.pk,
             defaults={
                 "created_on":instance.created_on,
@@ -4551,7 +5091,7 @@ def psave_hackathonevent(sender, instance, **kwargs):
     from search.models import SearchResult
     if instance.pk:
         SearchResult.objects.update_or_create(
-            source_type=ContentType.objects.get(app_label='dashboard', model='hackathonevent'),
+            source_type=ContentType.objects.get_for_model(HackathonEvent),
             source_id=instance.pk,
             defaults={
                 "created_on":instance.created_on,
@@ -4693,7 +5233,6 @@ class FeedbackEntry(SuperModel):
 
     @property
     def anonymized_comment(self):
-        import re
         replace_str = [
             self.bounty.bounty_owner_github_username,
             ]
@@ -4766,6 +5305,13 @@ class Earning(SuperModel):
     token_value = models.DecimalField(decimal_places=2, max_digits=50, default=0)
     network = models.CharField(max_length=50, default='')
 
+    class Meta:
+        """Define metadata associated with Earning."""
+
+        indexes = [
+            models.Index(fields=['source_type', 'source_id'], name='earning_gfk_idx'),
+        ]
+
     def __str__(self):
         return f"{self.from_profile} => {self.to_profile} of ${self.value_usd} on {self.created_on} for {self.source}"
 
@@ -19,9 +19,9 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
 import time
-from datetime import datetime
 
-from django.db.models import Count, F
+from django.db.models import Count, Exists, F, OuterRef
+from django.utils import timezone
 
 import django_filters.rest_framework
 from kudos.models import KudosTransfer, Token
@@ -35,6 +35,12 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# columns the bounties API may be ordered by (optionally prefixed with '-')
+BOUNTY_ORDERING_FIELDS = (
+    'web3_created', 'created_on', 'expires_date', 'value_in_usdt', 'value_in_usdt_now', '_val_usd_db',
+    'idx_project_length', 'idx_experience_level', 'standard_bounties_id', 'pk',
+)
+
 
 class BountyFulfillmentSerializer(serializers.ModelSerializer):
     """Handle serializing the BountyFulfillment object."""
@@ -321,16 +327,23 @@ class BountiesViewSet(viewsets.ModelViewSet):
 
         # filter by who is interested
         if 'started' in param_keys:
-            queryset = queryset.filter(interested__profile__handle__in=[self.request.query_params.get('started')])
+            handles = self.request.query_params.get('started', '').split(',')
+            handles = [handle.strip().lower() for handle in handles if handle.strip()]
+            queryset = queryset.annotate(
+                has_started=Exists(Interest.objects.filter(bounty=OuterRef('pk'), profile__handle__in=handles))
+            ).filter(has_started=True)
 
         # filter by is open or not
         if 'is_open' in param_keys:
-            queryset = queryset.filter(is_open=self.request.query_params.get('is_open', '').lower() == 'true')
-            queryset = queryset.filter(expires_date__gt=datetime.now())
+            if self.request.query_params.get('is_open', '').lower() == 'true':
+                queryset = queryset.open()
+            else:
+                queryset = queryset.filter(is_open=False, expires_date__gt=timezone.now())
 
         # filter by urls
         if 'github_url' in param_keys:
             urls = self.request.query_params.get('github_url').split(',')
+            urls = [url.strip() for url in urls if url.strip()]
             queryset = queryset.filter(github_url__in=urls)
 
         # filter by orgs
@@ -360,9 +373,10 @@ class BountiesViewSet(viewsets.ModelViewSet):
 
         # Retrieve all interested bounties by profile handle
         if 'interested_github_username' in param_keys:
-            queryset = queryset.filter(
-                interested__profile__handle=self.request.query_params.get('interested_github_username').lower()
-            )
+            handle = self.request.query_params.get('interested_github_username').lower()
+            queryset = queryset.annotate(
+                is_interested=Exists(Interest.objects.filter(bounty=OuterRef('pk'), profile__handle=handle))
+            ).filter(is_interested=True)
 
         # Retrieve all mod bounties.
         # TODO: Should we restrict this to staff only..? Technically I don't think we're worried about that atm?
@@ -411,9 +425,14 @@ class BountiesViewSet(viewsets.ModelViewSet):
         if order_by and order_by != 'null':
             if order_by == 'recently_marketed':
                 queryset = queryset.order_by(F('last_remarketed').desc(nulls_last = True), '-web3_created')
-            else:
+            elif order_by.lstrip('-') in BOUNTY_ORDERING_FIELDS:
                 queryset = queryset.order_by(order_by)
 
+        if 'no_of_applicants' in self.serializer_class.Meta.fields:
+            queryset = queryset.with_applicant_counts()
+        if 'status' in self.serializer_class.Meta.fields:
+            queryset = queryset.with_status_annotations()
+
         queryset = queryset.distinct()
 
         # offset / limit
@@ -454,6 +473,12 @@ class BountiesViewSetSlim(BountiesViewSet):
     queryset = Bounty.objects.all().order_by('-web3_created')
     serializer_class = BountySerializerSlim
 
+    def get_serializer(self, *args, **kwargs):
+        """Preload latest_activity for the whole page before serializing a list of bounties."""
+        if kwargs.get('many') and args:
+            args = (Bounty.attach_latest_activity(args[0]), ) + args[1:]
+        return super().get_serializer(*args, **kwargs)
+
 class BountiesViewSetCheckIn(BountiesViewSet):
     queryset = Bounty.objects.all().order_by('standard_bounties_id')
     serializer_class = BountySerializerCheckIn
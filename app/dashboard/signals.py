@@ -32,6 +32,8 @@ logger = logging.getLogger(__name__)
 
 def m2m_changed_interested(sender, instance, action, reverse, model, **kwargs):
     """Handle changes to Bounty interests."""
+    if not reverse:
+        instance.clear_status_cache()
     profile_handles = instance.profile_pairs
 
     if action in ['post_add', 'post_remove']:
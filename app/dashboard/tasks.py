@@ -4,7 +4,9 @@ from app.redis_service import RedisService
 from celery import app, group
 from celery.utils.log import get_task_logger
 from chat.tasks import create_channel
-from dashboard.models import Activity, Bounty, Profile
+from dashboard.models import (
+    Activity, Bounty, BountyFulfillment, Profile, Tip, update_fulfillment_earning, update_tip_earning,
+)
 from marketing.mails import func_name, grant_update_email, send_mail
 from retail.emails import render_share_bounty
 
@@ -121,3 +123,27 @@ def grant_update_email_task(self, pk, retry: bool = True) -> None:
     """
     activity = Activity.objects.get(pk=pk)
     grant_update_email(activity)
+
+
+@app.shared_task(bind=True, max_retries=3)
+def sync_tip_earning(self, pk, retry: bool = True) -> None:
+    """
+    :param self:
+    :param pk:
+    :return:
+    """
+    tip = Tip.objects.filter(pk=pk).first()
+    if tip:
+        update_tip_earning(tip)
+
+
+@app.shared_task(bind=True, max_retries=3)
+def sync_fulfillment_earning(self, pk, retry: bool = True) -> None:
+    """
+    :param self:
+    :param pk:
+    :return:
+    """
+    fulfillment = BountyFulfillment.objects.select_related('bounty').filter(pk=pk).first()
+    if fulfillment:
+        update_fulfillment_earning(fulfillment)
@@ -17,6 +17,7 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
+import json
 from datetime import date, datetime, timedelta
 
 from django.conf import settings
@@ -25,7 +26,7 @@ from django.utils import timezone
 
 import pytz
 from avatar.models import CustomAvatar, SocialAvatar
-from dashboard.models import Bounty, BountyFulfillment, Interest, Profile, Tip, Tool, ToolVote
+from dashboard.models import Bounty, BountyFulfillment, Interest, Profile, Tip, Tool, ToolVote, json_native
 from economy.models import ConversionRate, Token
 from test_plus.test import TestCase
 
@@ -308,6 +309,22 @@ class DashboardModelsTest(TestCase):
         bounty.override_status = "overridden"
         assert bounty.status == "overridden"
 
+    @staticmethod
+    def test_bounty_status_cache_cleared_on_interest_change():
+        bounty = Bounty.objects.create(
+            title='StatusCacheTest',
+            idx_status=0,
+            is_open=True,
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/12345680',
+            raw_data={}
+        )
+        assert bounty.status == 'open'
+        interest = Interest.objects.create(profile=Profile.objects.create(handle='worker', data={}), pending=False)
+        bounty.interested.add(interest)
+        assert bounty.status == 'started'
+
     @staticmethod
     def test_fetch_issue_comments():
         bounty = Bounty.objects.create(
@@ -419,6 +436,57 @@ class DashboardModelsTest(TestCase):
 
         assert bounty.can_remarket is False
 
+    @staticmethod
+    def test_no_of_applicants_reads_annotated_count():
+        bounty = Bounty.objects.create(
+            title='ApplicantCountTest',
+            idx_status=0,
+            is_open=True,
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/12345678',
+            raw_data={}
+        )
+        for handle in ['foo', 'bar']:
+            bounty.interested.create(profile=Profile.objects.create(handle=handle, data={}))
+
+        annotated_bounty = Bounty.objects.with_applicant_counts().get(pk=bounty.pk)
+
+        assert annotated_bounty.applicants_count == 2
+        assert annotated_bounty.no_of_applicants == 2
+        assert bounty.no_of_applicants == 2
+
+    @staticmethod
+    def test_annotate_user_started():
+        bounty = Bounty.objects.create(
+            title='UserStartedTest',
+            idx_status=0,
+            is_open=True,
+            web3_created=datetime(2008, 10, 31, tzinfo=pytz.UTC),
+            expires_date=datetime(2008, 11, 30, tzinfo=pytz.UTC),
+            github_url='https://github.com/gitcoinco/web/issues/12345679',
+            raw_data={}
+        )
+        bounty.interested.create(profile=Profile.objects.create(handle='starter', data={}), pending=False)
+
+        annotated_bounty = Bounty.objects.annotate_user_started('Starter').get(pk=bounty.pk)
+
+        assert annotated_bounty.has_started_work('starter') is True
+        assert annotated_bounty.has_started_work('someoneelse') is False
+
+    @staticmethod
+    def test_attach_org_profiles():
+        org = Profile.objects.create(handle='gitcoinco', data={})
+        bounties = [
+            Bounty(github_url='https://github.com/gitcoinco/web/issues/1'),
+            Bounty(github_url='https://github.com/unknownorg/web/issues/2'),
+        ]
+
+        Bounty.attach_org_profiles(bounties)
+
+        assert bounties[0].org_profile == org
+        assert bounties[1].org_profile is None
+
     @staticmethod
     def test_tip():
         """Test the dashboard Tip model."""
@@ -852,3 +920,8 @@ class DashboardModelsTest(TestCase):
         )
 
         assert bounty.total_reserved_length_label == '3 hours'
+
+    @staticmethod
+    def test_json_native_matches_json_round_trip():
+        data = {'a': (1, 2.5, None), 3: [True, {'b': ('c',)}], None: 'x', False: {}}
+        assert json_native(data) == json.loads(json.dumps(data))
@@ -151,7 +151,7 @@ def receive_tip_v3(request, key, txid, network):
             if params['save_addr']:
                 if profile:
                     profile.preferred_payout_address = eth_address
-                    profile.save()
+                    Profile.objects.filter(pk=profile.pk).update(preferred_payout_address=eth_address)
             tip.receive_txid = params['receive_txid']
             tip.receive_tx_status = 'pending'
             tip.receive_address = eth_address
@@ -808,7 +808,7 @@ def onboard(request, flow=None):
         valid_address = is_valid_eth_address(eth_address)
         if valid_address:
             profile.preferred_payout_address = eth_address
-            profile.save()
+            Profile.objects.filter(pk=profile.pk).update(preferred_payout_address=eth_address)
         return JsonResponse({'OK': True})
 
     theme = request.GET.get('theme', 'unisex')
@@ -2555,7 +2555,7 @@ def get_profile_tab(request, profile, tab, prev_context):
 
             else:
 
-                all_activities = profile.get_various_activities()
+                all_activities = profile.get_various_activities().feed().with_view_props(request.user)
                 paginator = Paginator(profile_filter_activities(all_activities, activity_type, activity_tabs), 10)
 
                 if page > paginator.num_pages:
@@ -2600,7 +2600,7 @@ def get_profile_tab(request, profile, tab, prev_context):
             if validated and request.POST.get('address'):
                 address = request.POST.get('address')
                 profile.preferred_payout_address = address
-                profile.save()
+                Profile.objects.filter(pk=profile.pk).update(preferred_payout_address=address)
                 msg = {
                     'status': 200,
                     'msg': _('Success!'),
@@ -4197,7 +4197,8 @@ def funder_dashboard_bounty_info(request, bounty_id):
 
 
 def serialize_funder_dashboard_open_rows(bounties, interests):
-    return [{'users_count': len([i for i in interests if b.pk in [i_b.pk for i_b in i.bounties]]),
+    interest_bounty_pks = [set(interest.bounty_pks) for interest in interests]
+    return [{'users_count': sum(b.pk in bounty_pks for bounty_pks in interest_bounty_pks),
              'title': b.title,
              'id': b.id,
              'standard_bounties_id': b.standard_bounties_id,
@@ -65,6 +65,18 @@ class EconomyUtilsTest(TestCase):
         result = convert_amount(2, 'ETH', 'USDT', datetime(2018, 1, 1))
         assert round(result, 1) == 10
 
+    def test_convert_amount_picks_up_new_rates(self):
+        """Test that memoized conversion rates are dropped when a ConversionRate is added."""
+        assert round(convert_amount(2, 'ETH', 'USDT'), 1) == 6
+        ConversionRate.objects.create(
+            from_amount=1,
+            to_amount=4,
+            source='etherdelta',
+            from_currency='ETH',
+            to_currency='USDT',
+        )
+        assert round(convert_amount(2, 'ETH', 'USDT'), 1) == 8
+
     def test_etherscan_link(self):
         """Test the economy util etherscan_link method."""
         txid = '0xcb39900d98fa00de2936d2770ef3bfef2cc289328b068e580dc68b7ac1e2055b'
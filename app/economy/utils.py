@@ -17,9 +17,20 @@ You should have received a copy of the GNU Affero General Public License
 along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 """
+import time
+
+from django.core.signals import request_started
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
 from cacheops import cached_as
 from economy.models import ConversionRate
 
+# (from_currency, to_currency, timestamp) -> (fetched_at, rate); see get_conversion_rate
+_conversion_rates = {}
+CONVERSION_RATE_CACHE_SIZE = 4096
+LATEST_CONVERSION_RATE_TTL = 60
+
 
 # All Units in native currency
 class TransactionException(Exception):
@@ -62,24 +73,58 @@ def convert_amount(from_amount, from_currency, to_currency, timestamp=None):
         to_currency = 'USDT'
 
 
-    if timestamp:
-        conversion_rate = ConversionRate.objects.filter(
-            from_currency=from_currency,
-            to_currency=to_currency,
-            timestamp__lte=timestamp
-        ).order_by('-timestamp').first()
-        if not conversion_rate:
-            return convert_amount(from_amount, from_currency, to_currency)
-    else:
-        conversion_rate = ConversionRate.objects.filter(
-            from_currency=from_currency,
-            to_currency=to_currency,
-        ).order_by('-timestamp').first()
+    rate = get_conversion_rate(from_currency, to_currency, timestamp)
+    if rate is None and timestamp:
+        return convert_amount(from_amount, from_currency, to_currency)
 
-    if not conversion_rate:
+    if rate is None:
         raise ConversionRateNotFoundError(f"ConversionRate {from_currency}/{to_currency} @ {timestamp} not found")
 
-    return (float(conversion_rate.to_amount) / float(conversion_rate.from_amount)) * float(from_amount)
+    return rate * float(from_amount)
+
+
+def get_conversion_rate(from_currency, to_currency, timestamp=None):
+    """Get the from_currency -> to_currency rate, memoized in-process.
+
+    Historical rates are kept until the cache is cleared (at the start of every request
+    and whenever a ConversionRate changes); the latest rate is also refreshed after
+    LATEST_CONVERSION_RATE_TTL seconds.
+
+    Args:
+        from_currency (str): The currency identifier to convert from.
+        to_currency (str): The currency identifier to convert to.
+        timestamp (datetime): Last available conversion rate at or before timestamp. Latest if None.
+
+    Returns:
+        float: The conversion rate, or None if no ConversionRate was found.
+
+    """
+    key = (from_currency, to_currency, timestamp)
+    now = time.monotonic()
+    cached = _conversion_rates.get(key)
+    if cached and (timestamp or now - cached[0] < LATEST_CONVERSION_RATE_TTL):
+        return cached[1]
+
+    conversion_rates = ConversionRate.objects.filter(from_currency=from_currency, to_currency=to_currency)
+    if timestamp:
+        conversion_rates = conversion_rates.filter(timestamp__lte=timestamp)
+    conversion_rate = conversion_rates.order_by('-timestamp').first()
+    if not conversion_rate:
+        return None
+
+    rate = float(conversion_rate.to_amount) / float(conversion_rate.from_amount)
+    if len(_conversion_rates) >= CONVERSION_RATE_CACHE_SIZE:
+        _conversion_rates.clear()
+    _conversion_rates[key] = (now, rate)
+    return rate
+
+
+@receiver(request_started, dispatch_uid="clear_conversion_rates_on_request")
+@receiver(post_save, sender=ConversionRate, dispatch_uid="clear_conversion_rates_on_save")
+@receiver(post_delete, sender=ConversionRate, dispatch_uid="clear_conversion_rates_on_delete")
+def clear_conversion_rate_cache(**kwargs):
+    """Drop all memoized conversion rates."""
+    _conversion_rates.clear()
 
 
 def convert_token_to_usdt(from_token, timestamp=None):
@@ -21,6 +21,7 @@ along with this program. If not, see <http://www.gnu.org/licenses/>.
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+import requests
 import twitter
 from dashboard.utils import get_web3
 from grants.models import Grant
@@ -39,6 +40,8 @@ class Command(BaseCommand):
             access_token_secret=settings.TWITTER_ACCESS_SECRET,
         )
 
+        w3 = get_web3('mainnet')
+        failed_lookups = []
         for grant in Grant.objects.all():
             try:
                 if grant.twitter_handle_1:
@@ -55,11 +58,16 @@ class Command(BaseCommand):
             except Exception as e:
                 print(e)
 
-            try:
-                if not grant.contract_owner_address:
-                    w3 = get_web3('mainnet')
-                    grant.contract_owner_address = w3.eth.getTransaction(grant.deploy_tx_id)['from']
+            if not grant.contract_owner_address:
+                try:
+                    tx = w3.eth.getTransaction(grant.deploy_tx_id)
+                except (ValueError, requests.RequestException):
+                    tx = None
+                if tx:
+                    grant.contract_owner_address = tx['from']
                     grant.save()
+                else:
+                    failed_lookups.append(grant.pk)
 
-            except Exception as e:
-                print(e)
+        if failed_lookups:
+            print(f'{len(failed_lookups)} grant deploy tx lookups failed: {failed_lookups}')
@@ -0,0 +1,24 @@
+# Generated by Django 2.2.4 on 2020-04-27 17:05
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('kudos', '0012_tokenrequest_bounty_url'),
+    ]
+
+    # Matches the UPPER(...) LIKE expression Django emits for the name__icontains lookups in Profile.get_org_kudos
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS kudos_token_name_trgm_idx "
+            "ON kudos_token USING gin (UPPER(name::text) gin_trgm_ops);",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS kudos_token_name_trgm_idx;",
+        ),
+    ]
@@ -42,7 +42,7 @@ class Command(BaseCommand):
             (Q(created_on__range=[end_time_3_days, start_time_3_days]) | Q(created_on__range=[end_time_7_days, start_time_7_days])),
             idx_status='open',
             network='mainnet'
-            )
+            ).with_applicant_counts()
 
         for bounty in [b for b in bounties if b.no_of_applicants == 0]:
             no_applicant_reminder(bounty.bounty_owner_email, bounty)
@@ -1130,7 +1130,7 @@ def activity(request):
     trending_only = int(request.GET.get('trending_only', 0))
 
     activities = get_specific_activities(what, trending_only, request.user, request.GET.get('after-pk'), request)
-    activities = activities.prefetch_related('profile', 'likes', 'comments', 'kudos', 'grant', 'subscription', 'hackathonevent')
+    activities = activities.feed().prefetch_related('comments').with_view_props(request.user)
 
     # store last seen
     if activities.exists():